@@ -0,0 +1,62 @@
+# -*- mode: python ; coding: utf-8 -*-
+"""
+PyInstaller spec for TaskPomodoro.
+
+Used by scripts/build_windows.py, or directly from the project root:
+    pyinstaller --noconfirm scripts/TaskPomodoro.spec [-- --onefile --console]
+
+Keep in sync with _cli_build_options() in build_windows.py.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--onefile", action="store_true", help="Build a single executable")
+parser.add_argument("--console", action="store_true", help="Show console window")
+options = parser.parse_args()
+
+project_root = Path(SPECPATH).parent
+icon_path = project_root / "assets" / "icon.ico"
+
+# Stripping symbols shrinks binaries on POSIX; PyInstaller ignores it on Windows
+strip = sys.platform != "win32"
+
+a = Analysis(
+    [str(project_root / "src" / "main.py")],
+    pathex=[str(project_root), str(project_root / "src")],
+    binaries=[],
+    datas=[(str(project_root / "assets"), "assets")],
+    hiddenimports=[],
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=[],
+    noarchive=False,
+)
+pyz = PYZ(a.pure)
+
+# UPX stays off: decompressing binaries would sit on the startup path
+exe_options = dict(
+    name="TaskPomodoro",
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=strip,
+    upx=False,
+    console=options.console,
+    icon=[str(icon_path)] if icon_path.exists() else None,
+)
+
+if options.onefile:
+    exe = EXE(pyz, a.scripts, a.binaries, a.datas, [], runtime_tmpdir=None, **exe_options)
+else:
+    exe = EXE(pyz, a.scripts, [], exclude_binaries=True, **exe_options)
+    coll = COLLECT(
+        exe,
+        a.binaries,
+        a.datas,
+        strip=strip,
+        upx=False,
+        name="TaskPomodoro",
+    )
@@ -54,37 +54,20 @@ if exist "dist" rmdir /s /q "dist"
 if exist "*.spec" del /q "*.spec"
 echo.
 
-REM Build executable
+REM Build executable (optimized bytecode: no asserts or docstrings)
 echo Building executable...
 echo.
+set PYTHONOPTIMIZE=2
 
 python -m PyInstaller ^
     --name=TaskPomodoro ^
-    --onefile ^
+    --onedir ^
     --windowed ^
-    --clean ^
+    --noupx ^
+    --noconfirm ^
+    --workpath="%LOCALAPPDATA%\taskpomodoro-pyinstaller\build" ^
     --paths=. ^
     --paths=src ^
-    --hidden-import=src.core ^
-    --hidden-import=src.core.app ^
-    --hidden-import=src.core.state ^
-    --hidden-import=src.core.timer ^
-    --hidden-import=src.core.notifications ^
-    --hidden-import=src.ui ^
-    --hidden-import=src.ui.theme ^
-    --hidden-import=src.ui.widgets ^
-    --hidden-import=src.ui.widgets.button ^
-    --hidden-import=src.ui.widgets.checkbox ^
-    --hidden-import=src.ui.widgets.clock_icon ^
-    --hidden-import=src.ui.widgets.toast ^
-    --hidden-import=src.ui.widgets.dialog ^
-    --hidden-import=src.ui.pages ^
-    --hidden-import=src.ui.pages.base_page ^
-    --hidden-import=src.ui.pages.starting_page ^
-    --hidden-import=src.ui.pages.working_page ^
-    --hidden-import=src.ui.pages.resting_page ^
-    --hidden-import=src.utils ^
-    --hidden-import=src.utils.formatting ^
     src\main.py
 
 if errorlevel 1 (
@@ -101,9 +84,9 @@ echo ============================================
 echo   BUILD SUCCESSFUL!
 echo ============================================
 echo.
-echo Executable location: %CD%\dist\TaskPomodoro.exe
+echo Executable location: %CD%\dist\TaskPomodoro\TaskPomodoro.exe
 echo.
-echo You can now distribute TaskPomodoro.exe!
+echo You can now distribute the dist\TaskPomodoro folder!
 echo.
 
 pause
\ No newline at end of file
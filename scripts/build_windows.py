@@ -6,21 +6,34 @@ This script builds the TaskPomodoro application into a standalone
 Windows executable using PyInstaller.
 
 Usage:
-    python scripts/build_windows.py [--onefile] [--console]
+    python scripts/build_windows.py [--onefile] [--console] [--clean [--deep]]
 
 Options:
-    --onefile   Create a single executable file (default: True)
+    --onefile   Create a single executable file (default: False, directory build)
     --console   Show console window (default: False, windowed mode)
+    --clean     Remove previous build output before building
+    --deep      With --clean, also discard PyInstaller's cached analysis
 """
 
 import os
 import sys
-import shutil
+import atexit
 import subprocess
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 import platform
-import os
+
+_SYSTEM = platform.system()
+
+# PyInstaller's work directory lives outside the project so its analysis
+# cache survives cleaning dist/ and is reused across builds
+BUILD_CACHE_DIR = (
+    Path(os.environ.get("LOCALAPPDATA", Path.home() / ".cache"))
+    / "taskpomodoro-pyinstaller"
+    / "build"
+)
 
 
 def get_project_root() -> Path:
@@ -48,15 +61,86 @@ def install_pyinstaller() -> bool:
     return result.returncode == 0
 
 
-def clean_build_dirs(project_root: Path) -> None:
-    """Clean previous build directories."""
-    dirs_to_clean = ["build", "dist", "__pycache__"]
+def _scandir_rmtree(path: Path) -> None:
+    """Remove a directory tree using os.scandir's cached entry types."""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _scandir_rmtree(Path(entry.path))
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+
+def _fast_rmtree(path: Path) -> None:
+    """
+    Remove a directory tree as quickly as the platform allows.
+    
+    Delegates to the native recursive delete (``rd /s /q`` or ``rm -rf``),
+    falling back to a scandir-based walker if that is unavailable or fails.
+    
+    Args:
+        path: Directory to remove
+    """
+    if _SYSTEM == "Windows":
+        cmd = ["cmd", "/c", "rd", "/s", "/q", str(path)]
+    else:
+        cmd = ["rm", "-rf", str(path)]
+    
+    try:
+        subprocess.run(cmd, check=False, capture_output=True)
+    except OSError:
+        pass
+    
+    if path.exists():
+        _scandir_rmtree(path)
+
+
+# Background deletions started by clean_build_dirs (joined at exit)
+_cleanup_pool: Optional[ThreadPoolExecutor] = None
+
+
+def _get_cleanup_pool() -> ThreadPoolExecutor:
+    """Get the shared cleanup pool, creating it on first use."""
+    global _cleanup_pool
+    if _cleanup_pool is None:
+        _cleanup_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="clean")
+        atexit.register(_cleanup_pool.shutdown, wait=True)
+    return _cleanup_pool
+
+
+def clean_build_dirs(project_root: Path, deep: bool = False) -> None:
+    """
+    Clean previous build directories.
+    
+    Each directory is renamed out of the way and then deleted in the
+    background, so the build can start while the old tree is removed.
+    
+    Args:
+        project_root: Project root directory
+        deep: Also discard PyInstaller's build cache (BUILD_CACHE_DIR)
+    """
+    dirs_to_clean = [project_root / name for name in ("build", "dist", "__pycache__")]
+    if deep:
+        dirs_to_clean.append(BUILD_CACHE_DIR)
+    pool = _get_cleanup_pool()
+    
+    # Leftovers from an interrupted previous cleanup
+    for parent in {dir_path.parent for dir_path in dirs_to_clean}:
+        for trash_path in parent.glob("*.__trash_*"):
+            pool.submit(_fast_rmtree, trash_path)
     
-    for dir_name in dirs_to_clean:
-        dir_path = project_root / dir_name
+    for i, dir_path in enumerate(dirs_to_clean):
         if dir_path.exists():
             print(f"Cleaning {dir_path}...")
-            shutil.rmtree(dir_path)
+            trash_path = dir_path.with_name(f"{dir_path.name}.__trash_{os.getpid()}_{i}")
+            try:
+                os.replace(dir_path, trash_path)
+            except OSError:
+                # Could not move it aside (e.g. a file is in use); delete in place
+                _fast_rmtree(dir_path)
+                continue
+            pool.submit(_fast_rmtree, trash_path)
     
     # Clean .spec files
     for spec_file in project_root.glob("*.spec"):
@@ -95,18 +179,70 @@ def create_icon_if_missing(project_root: Path) -> Path:
     return None
 
 
+def _cli_build_options(
+    project_root: Path,
+    main_script: Path,
+    onefile: bool,
+    console: bool,
+    icon_path: Optional[Path],
+) -> list:
+    """
+    Build the PyInstaller command-line options used when no spec file exists.
+    
+    Mirrors scripts/TaskPomodoro.spec.
+    """
+    options = ["--name=TaskPomodoro"]
+    
+    # Add bundle mode (onedir avoids the per-launch extraction of onefile)
+    options.append("--onefile" if onefile else "--onedir")
+    
+    # Never UPX-compress binaries: decompressing them would sit on the startup path
+    options.append("--noupx")
+    
+    # Strip debug symbols from bundled binaries (no-op on Windows, so skip it there)
+    if _SYSTEM != "Windows":
+        options.append("--strip")
+    
+    # Add windowed mode
+    if not console:
+        options.append("--windowed")
+    
+    # Add icon if exists (use resolved string path)
+    if icon_path:
+        options.append(f"--icon={str(icon_path.resolve())}")
+    
+    # Ensure assets folder is bundled so runtime can access images/icons
+    # PyInstaller expects path spec as SRC;DEST on Windows and SRC:DEST on POSIX
+    sep = ";" if _SYSTEM == "Windows" else ":"
+    assets_src = str((project_root / "assets").resolve())
+    options.append(f"--add-data={assets_src}{sep}assets")
+    
+    # Add paths
+    options.extend([
+        f"--paths={project_root}",
+        f"--paths={project_root / 'src'}",
+    ])
+    
+    # Add the main script
+    options.append(str(main_script))
+    
+    return options
+
+
 def build_executable(
     project_root: Path,
-    onefile: bool = True,
+    onefile: bool = False,
     console: bool = False,
+    clean: bool = False,
 ) -> bool:
     """
     Build the Windows executable.
     
     Args:
         project_root: Project root directory
-        onefile: Create single file executable
+        onefile: Create single file executable (unpacked to a temp dir on every launch)
         console: Show console window
+        clean: Discard PyInstaller's cache (BUILD_CACHE_DIR) and rebuild everything
         
     Returns:
         True if build succeeded
@@ -120,73 +256,40 @@ def build_executable(
     # Build PyInstaller command
     cmd = [
         sys.executable, "-m", "PyInstaller",
-        "--name=TaskPomodoro",
-        "--clean",
+        "--noconfirm",
+        f"--workpath={BUILD_CACHE_DIR}",
+        f"--distpath={project_root / 'dist'}",
     ]
     
-    # Add onefile option
-    if onefile:
-        cmd.append("--onefile")
-    else:
-        cmd.append("--onedir")
+    # Reuse PyInstaller's cached analysis unless a clean build was requested
+    if clean:
+        cmd.append("--clean")
     
-    # Add windowed mode
-    if not console:
-        cmd.append("--windowed")
-    
-    # Add icon if exists (use resolved string path)
+    # Create the icon first so either build path can pick it up
     icon_path = create_icon_if_missing(project_root)
-    if icon_path:
-        cmd.append(f"--icon={str(icon_path.resolve())}")
-
-    # Ensure assets folder is bundled so runtime can access images/icons
-    # PyInstaller expects path spec as SRC;DEST on Windows and SRC:DEST on POSIX
-    sep = ";" if platform.system() == "Windows" else ":"
-    assets_src = str((project_root / "assets").resolve())
-    cmd.append(f"--add-data={assets_src}{sep}assets")
-    
-    # Add paths
-    cmd.extend([
-        f"--paths={project_root}",
-        f"--paths={project_root / 'src'}",
-    ])
     
-    # Add hidden imports (for modules that might not be detected)
-    hidden_imports = [
-        "src.core",
-        "src.core.app",
-        "src.core.state",
-        "src.core.timer",
-        "src.core.notifications",
-        "src.ui",
-        "src.ui.theme",
-        "src.ui.widgets",
-        "src.ui.widgets.button",
-        "src.ui.widgets.checkbox",
-        "src.ui.widgets.clock_icon",
-        "src.ui.widgets.toast",
-        "src.ui.widgets.dialog",
-        "src.ui.pages",
-        "src.ui.pages.base_page",
-        "src.ui.pages.starting_page",
-        "src.ui.pages.working_page",
-        "src.ui.pages.resting_page",
-        "src.utils",
-        "src.utils.formatting",
-    ]
-    
-    for imp in hidden_imports:
-        cmd.append(f"--hidden-import={imp}")
-    
-    # Add the main script
-    cmd.append(str(main_script))
+    spec_path = project_root / "scripts" / "TaskPomodoro.spec"
+    if spec_path.exists():
+        # The committed spec holds the build configuration; only the
+        # bundle/console mode is forwarded to it (after "--")
+        cmd.append(str(spec_path))
+        spec_args = []
+        if onefile:
+            spec_args.append("--onefile")
+        if console:
+            spec_args.append("--console")
+        if spec_args:
+            cmd.extend(["--", *spec_args])
+    else:
+        cmd.extend(_cli_build_options(project_root, main_script, onefile, console, icon_path))
     
     print("Building executable...")
     print(f"Command: {' '.join(cmd)}")
     print()
     
-    # Run PyInstaller
-    result = subprocess.run(cmd, cwd=project_root)
+    # Run PyInstaller at -OO so bundled bytecode drops asserts and docstrings
+    env = {**os.environ, "PYTHONOPTIMIZE": "2"}
+    result = subprocess.run(cmd, cwd=project_root, env=env)
     
     return result.returncode == 0
 
@@ -199,13 +302,15 @@ def main():
     parser.add_argument(
         "--onefile",
         action="store_true",
-        default=True,
-        help="Create a single executable file (default)"
+        help=(
+            "Create a single executable file (smaller to ship, but slower startup: "
+            "the bundle is unpacked on every launch; UPX is never used)"
+        )
     )
     parser.add_argument(
         "--onedir",
         action="store_true",
-        help="Create a directory with executable and dependencies"
+        help="Create a directory with executable and dependencies (default)"
     )
     parser.add_argument(
         "--console",
@@ -215,7 +320,12 @@ def main():
     parser.add_argument(
         "--clean",
         action="store_true",
-        help="Clean build directories before building"
+        help="Clean build output directories before building"
+    )
+    parser.add_argument(
+        "--deep",
+        action="store_true",
+        help="With --clean, also discard PyInstaller's build cache"
     )
     
     args = parser.parse_args()
@@ -231,17 +341,19 @@ def main():
             sys.exit(1)
     
     # Clean if requested
+    deep_clean = args.clean and args.deep
     if args.clean:
-        clean_build_dirs(project_root)
+        clean_build_dirs(project_root, deep=deep_clean)
     
-    # Determine onefile setting
-    onefile = not args.onedir
+    # Determine onefile setting (onedir unless explicitly requested)
+    onefile = args.onefile and not args.onedir
     
     # Build
     success = build_executable(
         project_root,
         onefile=onefile,
-        console=args.console
+        console=args.console,
+        clean=deep_clean
     )
     
     if success:
@@ -3,7 +3,7 @@
 from .app import TaskPomodoroApp
 from .state import AppState, TimerState
 from .timer import TimerController
-from .notifications import send_notification
+from .notifications import send_notification, send_notification_async
 
 __all__ = [
     "TaskPomodoroApp",
@@ -11,4 +11,5 @@ __all__ = [
     "TimerState",
     "TimerController",
     "send_notification",
+    "send_notification_async",
 ]
\ No newline at end of file
@@ -5,17 +5,20 @@ The main Tkinter application window and page management.
 """
 
 import tkinter as tk
-from typing import Optional
+from typing import Callable, Dict, Optional
 
 from .state import AppState, TimerState, AppConfig
 from .timer import TimerController
-from ..ui.theme import Colors
-from ..ui.widgets import ModernCheckbox, Toast
-from ..ui.pages import StartingPage, WorkingPage, RestingPage, BasePage
+from .notifications import APP_USER_MODEL_ID, register_app_user_model_id
+from ..ui.theme import Colors, configure_ttk_styles
+from ..ui.widgets import ModernCheckbox, Toast, CustomDialog
+from ..ui.pages import StartingPage, BasePage
 from pathlib import Path
 import platform
 import ctypes
 
+_SYSTEM = platform.system()
+
 
 class TaskPomodoroApp(tk.Tk):
     """
@@ -29,11 +32,13 @@ class TaskPomodoroApp(tk.Tk):
         # This helps Windows associate the running process with the executable's
         # icon (useful when packaged with PyInstaller). Call this before
         # `super().__init__()` so the taskbar grouping picks up the AppID.
-        if platform.system() == "Windows":
+        if _SYSTEM == "Windows":
             try:
-                ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID("com.taskpomodoro.app")
+                ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(APP_USER_MODEL_ID)
             except Exception:
                 pass
+            # Lets in-process WinRT toasts show without a Start-menu shortcut
+            register_app_user_model_id()
 
         super().__init__()
         
@@ -42,6 +47,7 @@ class TaskPomodoroApp(tk.Tk):
         self.geometry("500x650")
         self.minsize(400, 500)
         self.configure(bg=Colors.BG_PRIMARY)
+        configure_ttk_styles(self)
         
         # Load application icon (prefer .ico for Windows taskbar, fallback to .png)
         try:
@@ -67,7 +73,14 @@ class TaskPomodoroApp(tk.Tk):
         
         # UI references
         self.current_page: Optional[BasePage] = None
+        self._pages: Dict[AppState, BasePage] = {}
+        self._page_factories: Dict[AppState, Callable[[], BasePage]] = {
+            AppState.STARTING: self._create_starting_page,
+            AppState.WORKING: self._create_working_page,
+            AppState.RESTING: self._create_resting_page,
+        }
         self.on_top_checkbox: Optional[ModernCheckbox] = None
+        self._confirm_dialog: Optional[CustomDialog] = None
         
         # Create UI
         self._create_bottom_bar()
@@ -95,40 +108,64 @@ class TaskPomodoroApp(tk.Tk):
     
     def show_toast(self, message: str) -> None:
         """Show a toast notification in the app."""
-        Toast(self, message)
+        Toast.show(self, message)
     
-    def _clear_page(self) -> None:
-        """Clear the current page."""
-        if self.current_page:
-            self.current_page.destroy()
-            self.current_page = None
+    def confirm(self, title: str, message: str, on_confirm: Callable[[], None]) -> None:
+        """
+        Ask for confirmation using the app's shared dialog.
+        
+        The dialog is built on first use and reused afterwards.
+        
+        Args:
+            title: Dialog title
+            message: Dialog message
+            on_confirm: Callback when confirmed
+        """
+        if self._confirm_dialog is None:
+            self._confirm_dialog = CustomDialog(self, title, message, on_confirm)
+        else:
+            self._confirm_dialog.show(title, message, on_confirm)
     
     # ═══════════════════════════════════════════════════════════════════════════
     # PAGE NAVIGATION
     # ═══════════════════════════════════════════════════════════════════════════
     
-    def _show_starting_page(self) -> None:
-        """Show the starting page."""
-        self._clear_page()
-        self.app_state = AppState.STARTING
+    def _show_page(self, state: AppState) -> None:
+        """
+        Switch to the page for the given state.
         
-        self.current_page = StartingPage(
+        Pages are built on first navigation and then kept, so later
+        switches only unpack and pack the cached frames.
+        
+        Args:
+            state: The application state whose page to show
+        """
+        if self.current_page:
+            self.current_page.pack_forget()
+        
+        self.app_state = state
+        page = self._pages.get(state)
+        if page is None:
+            page = self._page_factories[state]()
+            self._pages[state] = page
+        
+        page.on_show()
+        page.pack(fill=tk.BOTH, expand=True)
+        self.current_page = page
+    
+    def _create_starting_page(self) -> BasePage:
+        """Build the starting page."""
+        return StartingPage(
             self,
             on_start_work=self._show_working_page
         )
-        self.current_page.pack(fill=tk.BOTH, expand=True)
     
-    def _show_working_page(self) -> None:
-        """Show the working page."""
-        self._clear_page()
-        self.app_state = AppState.WORKING
-        self.timer_state.reset()
+    def _create_working_page(self) -> BasePage:
+        """Build the working page."""
+        # Imported on first use so only the starting page loads before first paint
+        from ..ui.pages.working_page import WorkingPage
         
-        # Stop any existing timer
-        if self.timer_controller:
-            self.timer_controller.stop()
-        
-        self.current_page = WorkingPage(
+        return WorkingPage(
             self,
             timer_state=self.timer_state,
             on_start=self._start_work_timer,
@@ -136,7 +173,33 @@ class TaskPomodoroApp(tk.Tk):
             on_stop=self._stop_and_reset,
             on_go_resting=self._show_resting_page
         )
-        self.current_page.pack(fill=tk.BOTH, expand=True)
+    
+    def _create_resting_page(self) -> BasePage:
+        """Build the resting page."""
+        from ..ui.pages.resting_page import RestingPage
+        
+        return RestingPage(
+            self,
+            timer_state=self.timer_state,
+            on_start=self._start_rest_timer,
+            on_pause=self._toggle_pause,
+            on_stop=self._stop_and_reset,
+            on_skip=self._skip_resting
+        )
+    
+    def _show_starting_page(self) -> None:
+        """Show the starting page."""
+        self._show_page(AppState.STARTING)
+    
+    def _show_working_page(self) -> None:
+        """Show the working page."""
+        self.timer_state.reset()
+        
+        # Stop any existing timer
+        if self.timer_controller:
+            self.timer_controller.stop()
+        
+        self._show_page(AppState.WORKING)
     
     def _show_resting_page(self) -> None:
         """Show the resting page."""
@@ -144,9 +207,6 @@ class TaskPomodoroApp(tk.Tk):
         if self.timer_controller:
             self.timer_controller.stop()
         
-        self._clear_page()
-        self.app_state = AppState.RESTING
-        
         # Calculate rest duration
         self.timer_state.rest_seconds = self.config.calculate_rest_duration(
             self.timer_state.elapsed_seconds
@@ -154,15 +214,7 @@ class TaskPomodoroApp(tk.Tk):
         self.timer_state.is_running = False
         self.timer_state.is_paused = False
         
-        self.current_page = RestingPage(
-            self,
-            timer_state=self.timer_state,
-            on_start=self._start_rest_timer,
-            on_pause=self._toggle_pause,
-            on_stop=self._stop_and_reset,
-            on_skip=self._skip_resting
-        )
-        self.current_page.pack(fill=tk.BOTH, expand=True)
+        self._show_page(AppState.RESTING)
     
     # ═══════════════════════════════════════════════════════════════════════════
     # TIMER CONTROLS
@@ -172,8 +224,9 @@ class TaskPomodoroApp(tk.Tk):
         """Start the work timer."""
         self.timer_controller = TimerController(
             timer_state=self.timer_state,
-            on_tick=lambda: self.after(0, self._update_display),
+            on_tick=self._update_display,
         )
+        self.timer_controller.bind_tk(self)
         self.timer_controller.start_work_timer()
         
         if self.current_page:
@@ -183,9 +236,10 @@ class TaskPomodoroApp(tk.Tk):
         """Start the rest timer."""
         self.timer_controller = TimerController(
             timer_state=self.timer_state,
-            on_tick=lambda: self.after(0, self._update_display),
-            on_complete=lambda: self.after(0, self._show_working_page),
+            on_tick=self._update_display,
+            on_complete=self._show_working_page,
         )
+        self.timer_controller.bind_tk(self)
         self.timer_controller.start_rest_timer()
         
         if self.current_page:
@@ -194,6 +248,14 @@ class TaskPomodoroApp(tk.Tk):
     def _toggle_pause(self) -> None:
         """Toggle timer pause state."""
         is_paused = self.timer_state.toggle_pause()
+        
+        # Cancel the pending tick while paused instead of ticking idly
+        if self.timer_controller:
+            if is_paused:
+                self.timer_controller.pause()
+            else:
+                self.timer_controller.resume()
+        
         if self.current_page:
             self.current_page.on_pause_toggled(is_paused)
     
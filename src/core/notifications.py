@@ -4,10 +4,31 @@ System Notifications Module
 Cross-platform notification support for Windows, macOS, and Linux.
 """
 
+import ctypes
 import platform
 import subprocess
+import threading
 from typing import Optional
 
+# Resolved once; platform.system() shells out to uname on some systems
+_SYSTEM = platform.system()
+
+# PowerShell string escaping, applied in a single pass
+_WIN_ESCAPE = str.maketrans({"'": "''", '"': '`"'})
+
+# AppUserModelID the app registers at startup and shows its toasts under
+APP_USER_MODEL_ID = "com.taskpomodoro.app"
+
+# (WinRT notifications module, toast notifier), created on the first
+# Windows notification (False: unavailable)
+_winrt_toasts = None
+
+# libnotify handle, loaded on the first Linux notification (False: unavailable)
+_libnotify = None
+
+# Serializes background sends so the platform backends never run concurrently
+_send_lock = threading.Lock()
+
 
 def send_notification(title: str, message: str) -> bool:
     """
@@ -20,7 +41,7 @@ def send_notification(title: str, message: str) -> bool:
     Returns:
         True if notification was sent successfully, False otherwise
     """
-    system = platform.system()
+    system = _SYSTEM
     
     try:
         if system == "Windows":
@@ -37,11 +58,103 @@ def send_notification(title: str, message: str) -> bool:
         return False
 
 
+def send_notification_async(title: str, message: str) -> None:
+    """
+    Send a system notification from a background thread.
+    
+    The platform backends can block (osascript, notify-send, a D-Bus
+    round-trip), so callers on the Tk main thread use this to keep
+    the UI responsive.
+    
+    Args:
+        title: Notification title
+        message: Notification message body
+    """
+    def run() -> None:
+        with _send_lock:
+            send_notification(title, message)
+    
+    threading.Thread(target=run, name="notification", daemon=True).start()
+
+
 def _send_windows_notification(title: str, message: str) -> bool:
+    """Send notification on Windows, in-process via WinRT when available."""
+    if _send_windows_notification_winrt(title, message):
+        return True
+    return _send_windows_notification_powershell(title, message)
+
+
+def register_app_user_model_id() -> None:
+    """
+    Register the app's AppUserModelID for the current user.
+    
+    Unpackaged apps need either a Start-menu shortcut carrying the ID or
+    this registry entry, otherwise Windows silently drops their toasts.
+    Safe to call on every start; does nothing off Windows.
+    """
+    if _SYSTEM != "Windows":
+        return
+    try:
+        import winreg
+        key_path = rf"Software\Classes\AppUserModelId\{APP_USER_MODEL_ID}"
+        with winreg.CreateKey(winreg.HKEY_CURRENT_USER, key_path) as key:
+            winreg.SetValueEx(key, "DisplayName", 0, winreg.REG_SZ, "TaskPomodoro")
+    except OSError as e:
+        print(f"Could not register AppUserModelID: {e}")
+
+
+def _load_winrt_toasts() -> Optional[tuple]:
+    """Create the WinRT toast notifier once; returns None if toasts cannot be shown."""
+    global _winrt_toasts
+    if _winrt_toasts is None:
+        _winrt_toasts = False
+        try:
+            from winrt.windows.ui import notifications as toasts
+        except ImportError:
+            try:
+                from winsdk.windows.ui import notifications as toasts
+            except ImportError:
+                return None
+        
+        try:
+            notifier = toasts.ToastNotificationManager.create_toast_notifier(APP_USER_MODEL_ID)
+            # Windows silently drops toasts for an unregistered AppUserModelID;
+            # reading the setting raises for such IDs, so anything but ENABLED
+            # leaves the other backends in charge
+            if notifier.setting == toasts.NotificationSetting.ENABLED:
+                _winrt_toasts = (toasts, notifier)
+        except Exception as e:
+            print(f"WinRT notifications unavailable: {e}")
+    return _winrt_toasts or None
+
+
+def _send_windows_notification_winrt(title: str, message: str) -> bool:
+    """Show a toast through the WinRT ToastNotificationManager (no subprocess)."""
+    winrt_toasts = _load_winrt_toasts()
+    if winrt_toasts is None:
+        return False
+    toasts, notifier = winrt_toasts
+    
+    try:
+        xml = toasts.ToastNotificationManager.get_template_content(
+            toasts.ToastTemplateType.TOAST_TEXT02
+        )
+        text_nodes = xml.get_elements_by_tag_name("text")
+        text_nodes.item(0).append_child(xml.create_text_node(title))
+        text_nodes.item(1).append_child(xml.create_text_node(message))
+        
+        notifier.show(toasts.ToastNotification(xml))
+        return True
+    except Exception as e:
+        print(f"WinRT notification error: {e}")
+        return False
+
+
+def _send_windows_notification_powershell(title: str, message: str) -> bool:
     """Send notification on Windows using PowerShell."""
     # Escape quotes for PowerShell
-    safe_title = title.replace("'", "''").replace('"', '`"')
-    safe_message = message.replace("'", "''").replace('"', '`"')
+    safe_title = title.translate(_WIN_ESCAPE)
+    safe_message = message.translate(_WIN_ESCAPE)
     
     ps_script = f'''
     Add-Type -AssemblyName System.Windows.Forms
@@ -106,7 +219,43 @@ def _send_macos_notification(title: str, message: str) -> bool:
         return False
 
 
+def _load_libnotify() -> Optional[ctypes.CDLL]:
+    """Load and initialise libnotify once; returns None if it is unavailable."""
+    global _libnotify
+    if _libnotify is None:
+        try:
+            lib = ctypes.CDLL("libnotify.so.4", mode=ctypes.RTLD_GLOBAL)
+            lib.notify_init.argtypes = [ctypes.c_char_p]
+            lib.notify_init.restype = ctypes.c_bool
+            lib.notify_notification_new.argtypes = [ctypes.c_char_p] * 3
+            lib.notify_notification_new.restype = ctypes.c_void_p
+            lib.notify_notification_show.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+            lib.notify_notification_show.restype = ctypes.c_bool
+            lib.g_object_unref.argtypes = [ctypes.c_void_p]
+            lib.g_object_unref.restype = None
+            _libnotify = lib if lib.notify_init(b"TaskPomodoro") else False
+        except (OSError, AttributeError):
+            _libnotify = False
+    return _libnotify or None
+
+
 def _send_linux_notification(title: str, message: str) -> bool:
+    """Send notification on Linux, in-process via libnotify when available."""
+    lib = _load_libnotify()
+    if lib is not None:
+        notification = lib.notify_notification_new(
+            title.encode("utf-8"), message.encode("utf-8"), None
+        )
+        if notification:
+            try:
+                if lib.notify_notification_show(notification, None):
+                    return True
+            finally:
+                lib.g_object_unref(notification)
+    return _send_linux_notification_subprocess(title, message)
+
+
+def _send_linux_notification_subprocess(title: str, message: str) -> bool:
     """Send notification on Linux using notify-send."""
     try:
         result = subprocess.run(
@@ -5,10 +5,16 @@ This module contains the state classes used throughout the application.
 Using dataclasses for clean, type-safe state management.
 """
 
+import sys
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Callable, Optional
 
+from ..utils.formatting import calculate_rest_duration
+
+# Slotted dataclasses need Python 3.10+; on 3.9 they keep a regular __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class AppState(Enum):
     """Represents the current page/state of the application."""
@@ -18,7 +24,7 @@ class AppState(Enum):
     RESTING = auto()
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class TimerState:
     """
     Holds the current state of the timer.
@@ -37,6 +43,16 @@ class TimerState:
     rest_seconds: int = 0
     last_hour_notified: int = 0
     
+    # Hour bookkeeping maintained by increment_work (not part of the public state)
+    _current_work_hour: int = field(default=0, init=False, repr=False)
+    _next_hour_at: int = field(default=3600, init=False, repr=False)
+    _hour_rolled: bool = field(default=False, init=False, repr=False)
+    
+    def __post_init__(self) -> None:
+        """Derive the hour bookkeeping from the initial elapsed time."""
+        self._current_work_hour = self.elapsed_seconds // 3600
+        self._next_hour_at = (self._current_work_hour + 1) * 3600
+    
     def reset(self) -> None:
         """Reset the timer state to initial values."""
         self.is_running = False
@@ -44,6 +60,9 @@ class TimerState:
         self.elapsed_seconds = 0
         self.rest_seconds = 0
         self.last_hour_notified = 0
+        self._current_work_hour = 0
+        self._next_hour_at = 3600
+        self._hour_rolled = False
     
     def start(self) -> None:
         """Start the timer."""
@@ -63,9 +82,15 @@ class TimerState:
         self.is_paused = not self.is_paused
         return self.is_paused
     
-    def increment_work(self) -> None:
-        """Increment work timer by one second."""
+    def increment_work(self) -> bool:
+        """Increment work timer by one second. Returns True if a new hour began."""
         self.elapsed_seconds += 1
+        if self.elapsed_seconds < self._next_hour_at:
+            return False
+        self._current_work_hour += 1
+        self._next_hour_at += 3600
+        self._hour_rolled = True
+        return True
     
     def decrement_rest(self) -> bool:
         """Decrement rest timer by one second. Returns True if rest is complete."""
@@ -75,18 +100,18 @@ class TimerState:
     @property
     def current_work_hour(self) -> int:
         """Get the current hour of work (0-indexed)."""
-        return self.elapsed_seconds // 3600
+        return self._current_work_hour
     
     def should_notify_hour(self) -> bool:
         """Check if we should send an hourly notification."""
-        current_hour = self.current_work_hour
-        if current_hour > self.last_hour_notified:
-            self.last_hour_notified = current_hour
-            return True
-        return False
+        if not self._hour_rolled:
+            return False
+        self._hour_rolled = False
+        self.last_hour_notified = self._current_work_hour
+        return True
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class AppConfig:
     """
     Application configuration settings.
@@ -105,8 +130,7 @@ class AppConfig:
     
     def calculate_rest_duration(self, work_seconds: int) -> int:
         """Calculate rest duration in seconds based on work duration."""
-        work_minutes = work_seconds // 60
-        rest_minutes = (work_minutes // self.work_ratio) * self.rest_ratio
-        if work_minutes % self.work_ratio > 0:
-            rest_minutes += self.rest_ratio
-        return max(self.min_rest_minutes, rest_minutes) * 60
\ No newline at end of file
+        # Shared, per-minute cached implementation in utils
+        return calculate_rest_duration(
+            work_seconds, self.min_rest_minutes, self.rest_ratio, self.work_ratio
+        )
\ No newline at end of file
@@ -1,23 +1,24 @@
 """
 Timer Controller Module
 
-Handles the timer logic in a separate thread with callbacks for UI updates.
+Handles the timer logic on the Tk event loop with callbacks for UI updates.
 """
 
-import threading
 import time
+import tkinter as tk
 from typing import Callable, Optional
 
 from .state import TimerState
-from .notifications import send_notification, NotificationMessages
+from .notifications import send_notification_async, NotificationMessages
 
 
 class TimerController:
     """
-    Controls the timer logic in a background thread.
+    Controls the timer logic using Tk's ``after`` scheduling.
     
     This class manages the timer counting and triggers callbacks
-    for UI updates and notifications.
+    for UI updates and notifications. Ticks run on the Tk main thread,
+    so callbacks may touch widgets directly.
     """
     
     def __init__(
@@ -41,27 +42,43 @@ class TimerController:
         self.on_complete = on_complete
         self.on_hour = on_hour
         
-        self._stop_flag = threading.Event()
-        self._thread: Optional[threading.Thread] = None
+        self._root: Optional[tk.Misc] = None
+        self._after_id: Optional[str] = None
+        self._tick_callback: Optional[Callable[[], None]] = None
+        self._next_tick = 0.0
+    
+    def bind_tk(self, root: tk.Misc) -> None:
+        """
+        Attach the Tk widget whose event loop drives the ticks.
+        
+        Args:
+            root: Any widget of the running Tk application (usually the root)
+        """
+        self._root = root
     
     def start_work_timer(self) -> None:
         """Start the work timer (counts up)."""
         self._stop()
         self.timer_state.start()
         self.timer_state.last_hour_notified = 0
-        self._stop_flag.clear()
-        
-        self._thread = threading.Thread(target=self._work_loop, daemon=True)
-        self._thread.start()
+        self._start_ticking(self._work_tick)
     
     def start_rest_timer(self) -> None:
         """Start the rest timer (counts down)."""
         self._stop()
         self.timer_state.start()
-        self._stop_flag.clear()
-        
-        self._thread = threading.Thread(target=self._rest_loop, daemon=True)
-        self._thread.start()
+        self._start_ticking(self._rest_tick)
+    
+    def pause(self) -> None:
+        """Pause the timer. No ticks are scheduled until resume()."""
+        self._stop()
+        self.timer_state.pause()
+    
+    def resume(self) -> None:
+        """Resume a paused timer; the next tick comes one second later."""
+        self.timer_state.resume()
+        if self._tick_callback is not None and self.timer_state.is_running:
+            self._start_ticking(self._tick_callback)
     
     def stop(self) -> None:
         """Stop the timer."""
@@ -71,50 +88,78 @@ class TimerController:
     
     def _stop(self) -> None:
         """Internal stop method."""
-        self._stop_flag.set()
-        if self._thread and self._thread.is_alive():
-            self._thread.join(timeout=1.0)
+        if self._after_id is not None and self._root is not None:
+            self._root.after_cancel(self._after_id)
+        self._after_id = None
     
-    def _work_loop(self) -> None:
-        """Main loop for work timer (counts up)."""
-        while not self._stop_flag.is_set():
-            if self.timer_state.is_running and not self.timer_state.is_paused:
-                self.timer_state.increment_work()
-                
-                # Check for hourly notification
-                if self.timer_state.should_notify_hour():
-                    hours = self.timer_state.current_work_hour
-                    title, message = NotificationMessages.hourly_update(hours)
-                    send_notification(title, message)
-                    
-                    if self.on_hour:
-                        self.on_hour(hours)
+    def _start_ticking(self, callback: Callable[[], None]) -> None:
+        """Begin calling ``callback`` once per second."""
+        if self._root is None:
+            raise RuntimeError("TimerController.bind_tk() must be called before starting")
+        self._tick_callback = callback
+        self._next_tick = time.monotonic() + 1.0
+        self._schedule_tick()
+    
+    def _schedule_tick(self) -> None:
+        """
+        Schedule the next tick.
+        
+        Deadlines advance in fixed one-second steps from time.monotonic(),
+        so event loop latency does not accumulate over long sessions.
+        After a longer stall (e.g. system sleep) the schedule restarts
+        from now instead of replaying every missed tick back-to-back.
+        """
+        now = time.monotonic()
+        if self._next_tick < now - 1.0:
+            self._next_tick = now
+        delay_ms = max(0, round((self._next_tick - now) * 1000))
+        self._next_tick += 1.0
+        self._after_id = self._root.after(delay_ms, self._tick_callback)
+    
+    def _work_tick(self) -> None:
+        """Single tick of the work timer (counts up)."""
+        # Reschedule first so a callback calling stop() cancels it
+        self._schedule_tick()
+        
+        state = self.timer_state
+        if state.is_running and not state.is_paused:
+            # Hourly notification check only runs when an hour boundary is crossed
+            if state.increment_work() and state.should_notify_hour():
+                hours = state.current_work_hour
+                title, message = NotificationMessages.hourly_update(hours)
+                send_notification_async(title, message)
                 
-                if self.on_tick:
-                    self.on_tick()
+                if self.on_hour:
+                    self.on_hour(hours)
             
-            time.sleep(1)
+            if self.on_tick:
+                self.on_tick()
     
-    def _rest_loop(self) -> None:
-        """Main loop for rest timer (counts down)."""
-        while not self._stop_flag.is_set() and self.timer_state.rest_seconds > 0:
-            if self.timer_state.is_running and not self.timer_state.is_paused:
-                is_complete = self.timer_state.decrement_rest()
-                
-                if self.on_tick:
-                    self.on_tick()
-                
-                if is_complete:
-                    title, message = NotificationMessages.rest_complete()
-                    send_notification(title, message)
-                    
-                    if self.on_complete:
-                        self.on_complete()
-                    return
+    def _rest_tick(self) -> None:
+        """Single tick of the rest timer (counts down)."""
+        self._after_id = None
+        if self.timer_state.rest_seconds <= 0:
+            return
+        
+        if not (self.timer_state.is_running and not self.timer_state.is_paused):
+            self._schedule_tick()
+            return
+        
+        is_complete = self.timer_state.decrement_rest()
+        if not is_complete:
+            self._schedule_tick()
+        
+        if self.on_tick:
+            self.on_tick()
+        
+        if is_complete:
+            title, message = NotificationMessages.rest_complete()
+            send_notification_async(title, message)
             
-            time.sleep(1)
+            if self.on_complete:
+                self.on_complete()
     
     @property
     def is_running(self) -> bool:
-        """Check if timer thread is running."""
-        return self._thread is not None and self._thread.is_alive()
\ No newline at end of file
+        """Check if a tick is scheduled."""
+        return self._after_id is not None
@@ -2,12 +2,21 @@
 
 from .base_page import BasePage
 from .starting_page import StartingPage
-from .working_page import WorkingPage
-from .resting_page import RestingPage
 
 __all__ = [
     "BasePage",
     "StartingPage",
     "WorkingPage",
     "RestingPage",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str):
+    """Import the timer pages on first access, keeping them off the startup path."""
+    if name == "WorkingPage":
+        from .working_page import WorkingPage
+        return WorkingPage
+    if name == "RestingPage":
+        from .resting_page import RestingPage
+        return RestingPage
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
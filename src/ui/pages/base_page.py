@@ -27,6 +27,9 @@ class BasePage(tk.Frame, ABC):
         """
         super().__init__(parent, bg=Colors.BG_PRIMARY)
         
+        # The owning window never changes, so look it up once
+        self._toplevel = parent.winfo_toplevel()
+        
         # Container for centered content
         self.container = tk.Frame(self, bg=Colors.BG_PRIMARY)
         self.container.place(relx=0.5, rely=0.5, anchor="center")
@@ -36,6 +39,10 @@ class BasePage(tk.Frame, ABC):
         """Update the timer display. Override in timer pages."""
         pass
     
+    def on_show(self) -> None:
+        """Called each time the page is shown. Override to reset state."""
+        pass
+    
     def on_timer_started(self) -> None:
         """Called when timer starts. Override in subclasses."""
         pass
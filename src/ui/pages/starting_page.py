@@ -8,7 +8,7 @@ import tkinter as tk
 from typing import Callable
 
 from .base_page import BasePage
-from ..theme import Colors, Fonts
+from ..theme import Colors, Fonts, get_font
 from ..widgets import RoundedButton, ClockIcon
 
 
@@ -46,7 +46,7 @@ class StartingPage(BasePage):
         title_label = tk.Label(
             self.container,
             text="TaskPomodoro",
-            font=(Fonts.FAMILY_PRIMARY, Fonts.SIZE_HEADING, "bold"),
+            font=get_font(Fonts.SIZE_HEADING, "bold"),
             bg=Colors.BG_PRIMARY,
             fg=Colors.TEXT_PRIMARY
         )
@@ -0,0 +1,196 @@
+"""
+Timer Page
+
+Shared base for the work and rest timer pages.
+"""
+
+import tkinter as tk
+from abc import abstractmethod
+from typing import Callable, Optional
+
+from .base_page import BasePage
+from ..theme import Colors, Fonts, get_font
+from ..widgets import RoundedButton, FlatButton
+from ...utils.formatting import format_duration
+from ...core.state import TimerState
+
+
+class TimerPage(BasePage):
+    """
+    Base class for pages showing a timer with controls.
+    
+    Lays out the title, timer display, start/pause/stop row and a
+    secondary long-press button. Subclasses set the texts and accent
+    colors below and say which seconds value to display.
+    """
+    
+    title = ""
+    accent = Colors.ACCENT_WARM
+    accent_hover = Colors.ACCENT_WARM_HOVER
+    secondary_text = ""
+    secondary_hint = ""
+    
+    def __init__(
+        self,
+        parent: tk.Widget,
+        timer_state: TimerState,
+        on_start: Callable[[], None],
+        on_pause: Callable[[], None],
+        on_stop: Callable[[], None],
+        on_secondary: Callable[[], None],
+    ):
+        """
+        Initialize the timer page.
+        
+        Args:
+            parent: Parent widget
+            timer_state: Timer state object
+            on_start: Callback to start timer
+            on_pause: Callback to pause/resume timer
+            on_stop: Callback to stop and reset
+            on_secondary: Callback for the long-press secondary button
+        """
+        super().__init__(parent)
+        
+        self.timer_state = timer_state
+        self.on_start = on_start
+        self.on_pause = on_pause
+        self.on_stop = on_stop
+        self.on_secondary = on_secondary
+        
+        # UI references
+        self.timer_label: Optional[tk.Label] = None
+        self._timer_var: Optional[tk.StringVar] = None
+        self._last_rendered = ""
+        self.start_btn: Optional[RoundedButton] = None
+        self.pause_btn: Optional[RoundedButton] = None
+        
+        self._create_widgets()
+    
+    @abstractmethod
+    def _get_seconds(self) -> int:
+        """Get the number of seconds to display."""
+        pass
+    
+    def _create_widgets(self) -> None:
+        """Create page widgets."""
+        # Title
+        label = tk.Label(
+            self.container,
+            text=self.title,
+            font=get_font(Fonts.SIZE_TITLE, "bold"),
+            bg=Colors.BG_PRIMARY,
+            fg=Colors.TEXT_PRIMARY
+        )
+        label.pack(pady=(0, 20))
+        
+        # Timer display
+        self._last_rendered = format_duration(self._get_seconds())
+        self._timer_var = tk.StringVar(self, value=self._last_rendered)
+        self.timer_label = tk.Label(
+            self.container,
+            textvariable=self._timer_var,
+            font=get_font(Fonts.SIZE_TIMER, "bold", Fonts.FAMILY_MONO),
+            bg=Colors.BG_PRIMARY,
+            fg=Colors.TEXT_PRIMARY
+        )
+        self.timer_label.pack(pady=(0, 30))
+        
+        # Control buttons row
+        # Fixed-size frame laid out with grid: the buttons' sizes are known,
+        # so their placement does not ripple relayouts up the container
+        btn_frame = tk.Frame(
+            self.container,
+            bg=Colors.BG_PRIMARY,
+            width=3 * (90 + 2 * 8),
+            height=40
+        )
+        btn_frame.grid_propagate(False)
+        btn_frame.pack(pady=(0, 25))
+        
+        self.start_btn = RoundedButton(
+            btn_frame,
+            text="Start",
+            command=self.on_start,
+            bg=self.accent,
+            hover_bg=self.accent_hover,
+            width=90,
+            height=40
+        )
+        self.start_btn.grid(row=0, column=0, padx=8)
+        
+        self.pause_btn = RoundedButton(
+            btn_frame,
+            text="Pause",
+            command=self.on_pause,
+            bg=Colors.BG_TERTIARY,
+            hover_bg=Colors.BG_HOVER,
+            width=90,
+            height=40,
+            disabled=True
+        )
+        self.pause_btn.grid(row=0, column=1, padx=8)
+        
+        stop_btn = RoundedButton(
+            btn_frame,
+            text="Stop",
+            command=self._confirm_stop,
+            bg=Colors.DANGER,
+            hover_bg=Colors.DANGER_LIGHT,
+            width=90,
+            height=40
+        )
+        stop_btn.grid(row=0, column=2, padx=8)
+        
+        # Secondary long-press button (go resting / skip resting)
+        secondary_btn = FlatButton(
+            self.container,
+            text=self.secondary_text,
+            long_press_command=self.on_secondary,
+            long_press_hint=self.secondary_hint
+        )
+        secondary_btn.pack()
+    
+    def _confirm_stop(self) -> None:
+        """Show confirmation dialog before stopping."""
+        self._toplevel.confirm(
+            "Confirmation",
+            "Are you sure you want to reset everything?",
+            self.on_stop
+        )
+    
+    def update_timer_display(self) -> None:
+        """Update the timer display while it is running and visible."""
+        if not self.timer_state.is_running or not self.winfo_viewable():
+            return
+        self._render_timer()
+    
+    def _render_timer(self) -> None:
+        """Render the timer text (skipped if the text is unchanged)."""
+        text = format_duration(self._get_seconds())
+        if text == self._last_rendered:
+            return
+        self._last_rendered = text
+        if self._timer_var:
+            self._timer_var.set(text)
+    
+    def on_show(self) -> None:
+        """Reset the controls and display when the page is (re)shown."""
+        if self.start_btn:
+            self.start_btn.set_disabled(False)
+        if self.pause_btn:
+            self.pause_btn.set_disabled(True)
+            self.pause_btn.update_text("Pause")
+        self._render_timer()
+    
+    def on_timer_started(self) -> None:
+        """Handle timer started event."""
+        if self.start_btn:
+            self.start_btn.set_disabled(True)
+        if self.pause_btn:
+            self.pause_btn.set_disabled(False)
+    
+    def on_pause_toggled(self, is_paused: bool) -> None:
+        """Handle pause state change."""
+        if self.pause_btn:
+            self.pause_btn.update_text("Resume" if is_paused else "Pause")
\ No newline at end of file
@@ -3,8 +3,88 @@ UI Theme Configuration
 
 Contains all colors, fonts, and styling constants used throughout the application.
 Centralized theme management for easy customization.
+
+Every constant is defined once at module level (cheap global lookups for
+hot drawing code) and aliased on the Colors/Fonts/Dimensions namespaces.
 """
 
+import tkinter as tk
+import tkinter.font as tkfont
+from tkinter import ttk
+from functools import lru_cache
+from typing import Final
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# COLORS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# Plain "#rrggbb" strings are intentional: Tk keeps a per-display cache of
+# allocated colors keyed by their spec, so repeated uses are table lookups.
+# Tk has no user-defined named colors to alias them with.
+
+# Backgrounds
+BG_PRIMARY: Final = "#1a1a1a"      # Main background (darkest)
+BG_SECONDARY: Final = "#2d2d2d"    # Secondary surfaces
+BG_TERTIARY: Final = "#3d3d3d"     # Cards, buttons
+BG_HOVER: Final = "#4a4a4a"        # Hover states
+
+# Accent colors
+ACCENT_WARM: Final = "#d97757"         # Primary warm accent (terracotta)
+ACCENT_WARM_HOVER: Final = "#e08a6d"   # Warm accent hover state
+ACCENT_COOL: Final = "#6b9fbe"         # Cool accent (blue) for rest mode
+ACCENT_COOL_HOVER: Final = "#7db0cf"   # Cool accent hover state
+
+# Text colors
+TEXT_PRIMARY: Final = "#f5f5f5"    # Primary text (almost white)
+TEXT_SECONDARY: Final = "#a0a0a0"  # Secondary/muted text
+TEXT_MUTED: Final = "#666666"      # Very muted/disabled text
+
+# Functional colors
+SUCCESS: Final = "#6bbd6b"         # Success states
+WARNING: Final = "#e0a458"         # Warning states
+DANGER: Final = "#cf6679"          # Danger/stop states
+DANGER_LIGHT: Final = "#d98a99"    # Danger hover state
+
+# UI elements
+BORDER: Final = "#404040"          # Borders and dividers
+SNACKBAR_BG: Final = "#383838"     # Toast/snackbar background
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# FONTS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+FAMILY_PRIMARY: Final = "Segoe UI"      # Primary UI font
+FAMILY_MONO: Final = "Consolas"         # Monospace for timer
+
+SIZE_SMALL: Final = 10
+SIZE_NORMAL: Final = 12
+SIZE_LARGE: Final = 14
+SIZE_TITLE: Final = 20
+SIZE_HEADING: Final = 32
+SIZE_TIMER: Final = 48
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# DIMENSIONS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+PADDING_SMALL: Final = 8
+PADDING_NORMAL: Final = 16
+PADDING_LARGE: Final = 24
+
+BUTTON_WIDTH: Final = 90
+BUTTON_HEIGHT: Final = 40
+BUTTON_WIDTH_LARGE: Final = 150
+BUTTON_HEIGHT_LARGE: Final = 48
+
+CORNER_RADIUS: Final = 12
+CORNER_RADIUS_SMALL: Final = 4
+
+WINDOW_WIDTH: Final = 500
+WINDOW_HEIGHT: Final = 650
+WINDOW_MIN_WIDTH: Final = 400
+WINDOW_MIN_HEIGHT: Final = 500
+
 
 class Colors:
     """
@@ -18,43 +98,43 @@ class Colors:
     # BACKGROUNDS
     # ═══════════════════════════════════════════════════════════════════════════
     
-    BG_PRIMARY = "#1a1a1a"      # Main background (darkest)
-    BG_SECONDARY = "#2d2d2d"    # Secondary surfaces
-    BG_TERTIARY = "#3d3d3d"     # Cards, buttons
-    BG_HOVER = "#4a4a4a"        # Hover states
+    BG_PRIMARY = BG_PRIMARY
+    BG_SECONDARY = BG_SECONDARY
+    BG_TERTIARY = BG_TERTIARY
+    BG_HOVER = BG_HOVER
     
     # ═══════════════════════════════════════════════════════════════════════════
     # ACCENT COLORS
     # ═══════════════════════════════════════════════════════════════════════════
     
-    ACCENT_WARM = "#d97757"         # Primary warm accent (terracotta)
-    ACCENT_WARM_HOVER = "#e08a6d"   # Warm accent hover state
-    ACCENT_COOL = "#6b9fbe"         # Cool accent (blue) for rest mode
-    ACCENT_COOL_HOVER = "#7db0cf"   # Cool accent hover state
+    ACCENT_WARM = ACCENT_WARM
+    ACCENT_WARM_HOVER = ACCENT_WARM_HOVER
+    ACCENT_COOL = ACCENT_COOL
+    ACCENT_COOL_HOVER = ACCENT_COOL_HOVER
     
     # ═══════════════════════════════════════════════════════════════════════════
     # TEXT COLORS
     # ═══════════════════════════════════════════════════════════════════════════
     
-    TEXT_PRIMARY = "#f5f5f5"    # Primary text (almost white)
-    TEXT_SECONDARY = "#a0a0a0"  # Secondary/muted text
-    TEXT_MUTED = "#666666"      # Very muted/disabled text
+    TEXT_PRIMARY = TEXT_PRIMARY
+    TEXT_SECONDARY = TEXT_SECONDARY
+    TEXT_MUTED = TEXT_MUTED
     
     # ═══════════════════════════════════════════════════════════════════════════
     # FUNCTIONAL COLORS
     # ═══════════════════════════════════════════════════════════════════════════
     
-    SUCCESS = "#6bbd6b"         # Success states
-    WARNING = "#e0a458"         # Warning states
-    DANGER = "#cf6679"          # Danger/stop states
-    DANGER_LIGHT = "#d98a99"    # Danger hover state
+    SUCCESS = SUCCESS
+    WARNING = WARNING
+    DANGER = DANGER
+    DANGER_LIGHT = DANGER_LIGHT
     
     # ═══════════════════════════════════════════════════════════════════════════
     # UI ELEMENTS
     # ═══════════════════════════════════════════════════════════════════════════
     
-    BORDER = "#404040"          # Borders and dividers
-    SNACKBAR_BG = "#383838"     # Toast/snackbar background
+    BORDER = BORDER
+    SNACKBAR_BG = SNACKBAR_BG
 
 
 class Fonts:
@@ -65,16 +145,76 @@ class Fonts:
     """
     
     # Font families (with fallbacks)
-    FAMILY_PRIMARY = "Segoe UI"      # Primary UI font
-    FAMILY_MONO = "Consolas"         # Monospace for timer
+    FAMILY_PRIMARY = FAMILY_PRIMARY
+    FAMILY_MONO = FAMILY_MONO
     
     # Font sizes
-    SIZE_SMALL = 10
-    SIZE_NORMAL = 12
-    SIZE_LARGE = 14
-    SIZE_TITLE = 20
-    SIZE_HEADING = 32
-    SIZE_TIMER = 48
+    SIZE_SMALL = SIZE_SMALL
+    SIZE_NORMAL = SIZE_NORMAL
+    SIZE_LARGE = SIZE_LARGE
+    SIZE_TITLE = SIZE_TITLE
+    SIZE_HEADING = SIZE_HEADING
+    SIZE_TIMER = SIZE_TIMER
+
+
+@lru_cache(maxsize=None)
+def get_font(size: int, weight: str = "normal", family: str = FAMILY_PRIMARY) -> tkfont.Font:
+    """
+    Get a shared font object.
+    
+    Tk resolves each font once and every widget using it shares the
+    metrics, instead of re-parsing a font tuple per widget or canvas item.
+    The cache is unbounded because it holds the only reference to each
+    named font; evicting one would delete it from widgets still using it.
+    Must be called after the Tk root has been created.
+    
+    Args:
+        size: Font size in points
+        weight: "normal" or "bold"
+        family: Font family
+        
+    Returns:
+        Cached tkinter Font
+    """
+    return tkfont.Font(family=family, size=size, weight=weight)
+
+
+FLAT_BUTTON_STYLE: Final = "Flat.TButton"
+
+
+def configure_ttk_styles(root: tk.Misc) -> None:
+    """
+    Configure the ttk styles used by themed widgets.
+    
+    Call once after the Tk root has been created. Uses the "clam" theme,
+    since native themes ignore custom button colors.
+    
+    Args:
+        root: The application root window
+    """
+    style = ttk.Style(root)
+    style.theme_use("clam")
+    
+    style.configure(
+        FLAT_BUTTON_STYLE,
+        background=BG_SECONDARY,
+        foreground=TEXT_PRIMARY,
+        bordercolor=BG_SECONDARY,
+        lightcolor=BG_SECONDARY,
+        darkcolor=BG_SECONDARY,
+        focuscolor=BG_SECONDARY,
+        borderwidth=0,
+        relief="flat",
+        padding=(24, 10),
+        font=get_font(SIZE_NORMAL)
+    )
+    style.map(
+        FLAT_BUTTON_STYLE,
+        background=[("pressed", BG_HOVER), ("active", BG_TERTIARY)],
+        bordercolor=[("pressed", BG_HOVER), ("active", BG_TERTIARY)],
+        lightcolor=[("pressed", BG_HOVER), ("active", BG_TERTIARY)],
+        darkcolor=[("pressed", BG_HOVER), ("active", BG_TERTIARY)]
+    )
 
 
 class Dimensions:
@@ -83,22 +223,22 @@ class Dimensions:
     """
     
     # Padding
-    PADDING_SMALL = 8
-    PADDING_NORMAL = 16
-    PADDING_LARGE = 24
+    PADDING_SMALL = PADDING_SMALL
+    PADDING_NORMAL = PADDING_NORMAL
+    PADDING_LARGE = PADDING_LARGE
     
     # Button dimensions
-    BUTTON_WIDTH = 90
-    BUTTON_HEIGHT = 40
-    BUTTON_WIDTH_LARGE = 150
-    BUTTON_HEIGHT_LARGE = 48
+    BUTTON_WIDTH = BUTTON_WIDTH
+    BUTTON_HEIGHT = BUTTON_HEIGHT
+    BUTTON_WIDTH_LARGE = BUTTON_WIDTH_LARGE
+    BUTTON_HEIGHT_LARGE = BUTTON_HEIGHT_LARGE
     
     # Corner radius
-    CORNER_RADIUS = 12
-    CORNER_RADIUS_SMALL = 4
+    CORNER_RADIUS = CORNER_RADIUS
+    CORNER_RADIUS_SMALL = CORNER_RADIUS_SMALL
     
     # Window
-    WINDOW_WIDTH = 500
-    WINDOW_HEIGHT = 650
-    WINDOW_MIN_WIDTH = 400
-    WINDOW_MIN_HEIGHT = 500
\ No newline at end of file
+    WINDOW_WIDTH = WINDOW_WIDTH
+    WINDOW_HEIGHT = WINDOW_HEIGHT
+    WINDOW_MIN_WIDTH = WINDOW_MIN_WIDTH
+    WINDOW_MIN_HEIGHT = WINDOW_MIN_HEIGHT
\ No newline at end of file
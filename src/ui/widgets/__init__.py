@@ -1,6 +1,7 @@
 """Custom UI widgets."""
 
 from .button import RoundedButton
+from .flat_button import FlatButton
 from .checkbox import ModernCheckbox
 from .clock_icon import ClockIcon
 from .toast import Toast
@@ -8,6 +9,7 @@ from .dialog import CustomDialog
 
 __all__ = [
     "RoundedButton",
+    "FlatButton",
     "ModernCheckbox",
     "ClockIcon",
     "Toast",
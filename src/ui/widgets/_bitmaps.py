@@ -0,0 +1,198 @@
+"""
+Widget Bitmap Cache
+
+Pre-rendered images for the canvas-drawn widgets.
+
+Shapes are rasterized once per unique (size, color) combination with
+anti-aliased edges blended against the known background color, and the
+resulting PhotoImages are cached so widgets only swap image references
+when their state changes. Uses plain Tk PhotoImages (no Pillow needed).
+
+The caches are unbounded on purpose: they hold the only Python reference
+to each image, and evicting one would delete the Tk image out from under
+the widgets still showing it. The app only uses a handful of
+size/color combinations.
+"""
+
+import math
+import tkinter as tk
+from functools import lru_cache
+from typing import Callable
+
+
+def _hex_to_rgb(color: str) -> tuple:
+    """Convert a "#rrggbb" color to an (r, g, b) tuple."""
+    return int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
+
+
+def _blend(fg: tuple, bg: tuple, alpha: float) -> str:
+    """Blend two RGB tuples and return a "#rrggbb" color."""
+    return "#%02x%02x%02x" % tuple(round(b + (f - b) * alpha) for f, b in zip(fg, bg))
+
+
+def _rounded_rect_rows(width: int, height: int, radius: int, color: str, bg: str) -> list:
+    """
+    Rasterize a rounded rectangle into rows of pixel colors.
+    
+    Pixels are covered by how far their center lies inside the nearest
+    corner circle, which anti-aliases the corners.
+    """
+    fg_rgb, bg_rgb = _hex_to_rgb(color), _hex_to_rgb(bg)
+    solid_row = [color] * width
+    rows = []
+    
+    for py in range(height):
+        y = py + 0.5
+        if radius <= py and py + 1 <= height - radius:
+            rows.append(solid_row)
+            continue
+        cy = min(max(y, radius), height - radius)
+        row = []
+        for px in range(width):
+            x = px + 0.5
+            cx = min(max(x, radius), width - radius)
+            coverage = min(1.0, max(0.0, radius - math.hypot(x - cx, y - cy) + 0.5))
+            row.append(color if coverage >= 1.0 else _blend(fg_rgb, bg_rgb, coverage))
+        rows.append(row)
+    
+    return rows
+
+
+def _segment_distance(x: float, y: float, x1: float, y1: float, x2: float, y2: float) -> float:
+    """Distance from point (x, y) to the segment (x1, y1)-(x2, y2)."""
+    dx, dy = x2 - x1, y2 - y1
+    t = ((x - x1) * dx + (y - y1) * dy) / (dx * dx + dy * dy)
+    t = min(1.0, max(0.0, t))
+    return math.hypot(x - (x1 + t * dx), y - (y1 + t * dy))
+
+
+def _paint_rows(rows: list, coverage_at: Callable[[float, float], float], color: str) -> list:
+    """
+    Blend a color over rasterized rows by per-pixel coverage.
+    
+    Returns new rows; the input rows (which may share row lists) are untouched.
+    """
+    fg_rgb = _hex_to_rgb(color)
+    out = []
+    
+    for py, row in enumerate(rows):
+        y = py + 0.5
+        new_row = list(row)
+        for px in range(len(row)):
+            coverage = min(1.0, max(0.0, coverage_at(px + 0.5, y)))
+            if coverage > 0.0:
+                new_row[px] = _blend(fg_rgb, _hex_to_rgb(row[px]), coverage)
+        out.append(new_row)
+    
+    return out
+
+
+def _stroke_rows(rows: list, segments: tuple, width: float, color: str) -> list:
+    """Draw anti-aliased, round-capped line segments over rasterized rows."""
+    half = width / 2
+    
+    def coverage_at(x: float, y: float) -> float:
+        return half - min(_segment_distance(x, y, *segment) for segment in segments) + 0.5
+    
+    return _paint_rows(rows, coverage_at, color)
+
+
+def _ring_rows(rows: list, cx: float, cy: float, radius: float, width: float, color: str) -> list:
+    """Draw an anti-aliased circle outline over rasterized rows."""
+    half = width / 2
+    
+    def coverage_at(x: float, y: float) -> float:
+        return half - abs(math.hypot(x - cx, y - cy) - radius) + 0.5
+    
+    return _paint_rows(rows, coverage_at, color)
+
+
+def _rows_to_image(rows: list) -> tk.PhotoImage:
+    """Create a PhotoImage from rows of "#rrggbb" colors."""
+    image = tk.PhotoImage(width=len(rows[0]), height=len(rows))
+    image.put(" ".join("{" + " ".join(row) + "}" for row in rows))
+    return image
+
+
+@lru_cache(maxsize=None)
+def get_button_bitmap(width: int, height: int, radius: int, color: str, bg: str) -> tk.PhotoImage:
+    """
+    Get a cached rounded-rectangle button background.
+    
+    Must be called after the Tk root has been created.
+    
+    Args:
+        width: Image width in pixels
+        height: Image height in pixels
+        radius: Corner radius
+        color: Fill color
+        bg: Color of the canvas behind the image (for edge blending)
+    
+    Returns:
+        Cached PhotoImage
+    """
+    return _rows_to_image(_rounded_rect_rows(width, height, radius, color, bg))
+
+
+@lru_cache(maxsize=None)
+def get_checkbox_bitmap(
+    size: int,
+    checked: bool,
+    color_on: str,
+    color_off: str,
+    check_color: str,
+    bg: str,
+) -> tk.PhotoImage:
+    """
+    Get a cached checkbox box, with the checkmark drawn in when checked.
+    
+    Must be called after the Tk root has been created.
+    
+    Args:
+        size: Box size in pixels
+        checked: Whether to draw the checked state
+        color_on: Box color when checked
+        color_off: Box color when unchecked
+        check_color: Checkmark color
+        bg: Color of the canvas behind the image (for edge blending)
+    
+    Returns:
+        Cached PhotoImage
+    """
+    rows = _rounded_rect_rows(size, size, 4, color_on if checked else color_off, bg)
+    if checked:
+        c = size // 2
+        checkmark = (
+            (c - 4, c, c - 1, c + 3),
+            (c - 1, c + 3, c + 5, c - 4),
+        )
+        rows = _stroke_rows(rows, checkmark, 2, check_color)
+    return _rows_to_image(rows)
+
+
+@lru_cache(maxsize=None)
+def get_clock_bitmap(size: int, color: str, bg: str) -> tk.PhotoImage:
+    """
+    Get a cached clock icon (circle with hands at 12 and 3).
+    
+    Must be called after the Tk root has been created.
+    
+    Args:
+        size: Icon size in pixels
+        color: Icon color
+        bg: Background color
+        
+    Returns:
+        Cached PhotoImage
+    """
+    c = size // 2
+    r = size // 2 - 4
+    hands = (
+        (c, c, c, c - r * 0.5),     # Hour hand (pointing to 12)
+        (c, c, c + r * 0.35, c),    # Minute hand (pointing to 3)
+    )
+    
+    rows = [[bg] * size] * size
+    rows = _ring_rows(rows, c, c, r, 3, color)
+    rows = _stroke_rows(rows, hands, 3, color)
+    return _rows_to_image(rows)
@@ -0,0 +1,27 @@
+"""
+Geometry Helpers
+
+Window geometry lookups for positioning popups.
+"""
+
+import tkinter as tk
+
+
+def _parent_bbox(parent: tk.Misc) -> tuple:
+    """
+    Get a window's on-screen client area.
+    
+    The four values are fetched in a single Tcl call. They are not cached:
+    invalidating a cache needs a <Configure> binding on the root, which
+    every child widget's <Configure> event would also run.
+    
+    Args:
+        parent: The window to measure
+        
+    Returns:
+        (root x, root y, width, height) in pixels
+    """
+    w = parent._w
+    return tuple(map(int, parent.tk.eval(
+        f"list [winfo rootx {w}] [winfo rooty {w}] [winfo width {w}] [winfo height {w}]"
+    ).split()))
\ No newline at end of file
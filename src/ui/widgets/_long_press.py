@@ -0,0 +1,52 @@
+"""
+Long Press Timer
+
+Shared press timer for the buttons supporting the long-press gesture.
+"""
+
+import tkinter as tk
+from typing import Optional
+
+
+class _LongPressManager:
+    """
+    Owns the single pending long-press timer.
+    
+    Only one button can be held at a time with a single pointer, so all
+    buttons share one ``after`` handle instead of tracking their own.
+    """
+    
+    _button: Optional[tk.Widget] = None
+    _handle: Optional[str] = None
+    
+    @classmethod
+    def start(cls, button: tk.Widget, delay_ms: int) -> None:
+        """Start timing a press on ``button``, replacing any pending one."""
+        if cls._handle is not None:
+            cls._button.after_cancel(cls._handle)
+        cls._button = button
+        cls._handle = button.after(delay_ms, cls._fire)
+    
+    @classmethod
+    def cancel(cls, button: tk.Widget) -> bool:
+        """
+        Cancel the pending timer if it belongs to ``button``.
+        
+        Returns:
+            True if a press on ``button`` was still pending (a short press)
+        """
+        if cls._button is not button:
+            return False
+        button.after_cancel(cls._handle)
+        cls._button = None
+        cls._handle = None
+        return True
+    
+    @classmethod
+    def _fire(cls) -> None:
+        """Deliver the long press to the held button via its _on_long_press()."""
+        button = cls._button
+        cls._button = None
+        cls._handle = None
+        if button is not None:
+            button._on_long_press()
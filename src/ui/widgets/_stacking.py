@@ -0,0 +1,44 @@
+"""
+Stacking Helpers
+
+Briefly raise popups over the main window without pinning them on top.
+"""
+
+import tkinter as tk
+
+# How long a popup stays topmost after being shown
+TOPMOST_MS = 50
+
+
+def _raise_briefly(window: tk.Toplevel, parent: tk.Misc) -> None:
+    """
+    Lift ``window`` above everything, then drop the topmost flag.
+    
+    A permanent topmost flag makes the window manager re-evaluate
+    stacking on every event. If the parent is pinned on top itself
+    ("Always on top"), the popup keeps the flag so it cannot fall
+    behind its parent.
+    
+    Args:
+        window: The popup being shown
+        parent: The window the popup belongs to
+    """
+    window.attributes("-topmost", True)
+    window.lift()
+    
+    pending = getattr(window, "_topmost_reset_id", None)
+    if pending is not None:
+        window.after_cancel(pending)
+        window._topmost_reset_id = None
+    
+    if not int(parent.winfo_toplevel().attributes("-topmost")):
+        window._topmost_reset_id = window.after(TOPMOST_MS, lambda: _drop_topmost(window))
+
+
+def _drop_topmost(window: tk.Toplevel) -> None:
+    """Clear the topmost flag set by _raise_briefly()."""
+    window._topmost_reset_id = None
+    try:
+        window.attributes("-topmost", False)
+    except tk.TclError:
+        pass
\ No newline at end of file
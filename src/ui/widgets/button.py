@@ -5,10 +5,14 @@ A modern, rounded button with hover effects and long-press support.
 """
 
 import tkinter as tk
-import time
 from typing import Callable, Optional
 
-from ..theme import Colors, Fonts, Dimensions
+from ..theme import (
+    Colors, Fonts, Dimensions, get_font,
+    BG_PRIMARY, BG_HOVER, TEXT_MUTED,
+)
+from ._bitmaps import get_button_bitmap
+from ._long_press import _LongPressManager
 
 
 class RoundedButton(tk.Canvas):
@@ -60,8 +64,9 @@ class RoundedButton(tk.Canvas):
             parent,
             width=width,
             height=height,
-            bg=Colors.BG_PRIMARY,
-            highlightthickness=0
+            bg=BG_PRIMARY,
+            highlightthickness=0,
+            cursor="" if disabled else "hand2"
         )
         
         self.text = text
@@ -80,44 +85,52 @@ class RoundedButton(tk.Canvas):
         self.fg = fg
         self.current_bg = self.bg_normal
         
-        # Long press tracking
-        self.press_start_time: Optional[float] = None
+        # Long press tracking (the timer itself lives in _LongPressManager)
         self.long_press_threshold = 0.5  # seconds
-        self.long_press_timer: Optional[str] = None
         
-        self._draw()
+        self._build_items()
         if not disabled:
             self._bind_events()
     
-    def _draw(self) -> None:
-        """Draw the button."""
-        self.delete("all")
+    def _build_items(self) -> None:
+        """Create the button's canvas items once; later updates only swap images."""
+        # Pre-rendered rounded backgrounds for both states, inset 2px like the
+        # original shape; hovering only changes which one is stacked on top
+        self._body_hover_id = self.create_image(2, 2, anchor="nw")
+        self._body_normal_id = self.create_image(2, 2, anchor="nw")
         
-        r = self.corner_radius
-        x1, y1 = 2, 2
-        x2, y2 = self.btn_width - 2, self.btn_height - 2
-        
-        bg = Colors.BG_HOVER if self._disabled else self.current_bg
-        fg = Colors.TEXT_MUTED if self._disabled else self.fg
-        
-        # Draw rounded rectangle using arcs and rectangles
-        self.create_arc(x1, y1, x1 + 2*r, y1 + 2*r, start=90, extent=90, fill=bg, outline=bg)
-        self.create_arc(x2 - 2*r, y1, x2, y1 + 2*r, start=0, extent=90, fill=bg, outline=bg)
-        self.create_arc(x1, y2 - 2*r, x1 + 2*r, y2, start=180, extent=90, fill=bg, outline=bg)
-        self.create_arc(x2 - 2*r, y2 - 2*r, x2, y2, start=270, extent=90, fill=bg, outline=bg)
-        
-        self.create_rectangle(x1 + r, y1, x2 - r, y2, fill=bg, outline=bg)
-        self.create_rectangle(x1, y1 + r, x2, y2 - r, fill=bg, outline=bg)
-        
-        # Draw text
-        self.create_text(
+        self._text_id = self.create_text(
             self.btn_width // 2,
             self.btn_height // 2,
-            text=self.text,
-            fill=fg,
-            font=(Fonts.FAMILY_PRIMARY, self.font_size)
+            font=get_font(self.font_size)
+        )
+        
+        self._refresh()
+    
+    def _body_image(self, color: str) -> tk.PhotoImage:
+        """Get the cached background bitmap for a body color."""
+        return get_button_bitmap(
+            self.btn_width - 4,
+            self.btn_height - 4,
+            self.corner_radius,
+            color,
+            BG_PRIMARY
         )
     
+    def _refresh(self) -> None:
+        """Apply the current colors and text to the existing canvas items."""
+        normal_bg = BG_HOVER if self._disabled else self.bg_normal
+        fg = TEXT_MUTED if self._disabled else self.fg
+        hovered = not self._disabled and self.current_bg == self.bg_hover
+        
+        self.itemconfig(self._body_normal_id, image=self._body_image(normal_bg))
+        self.itemconfig(self._body_hover_id, image=self._body_image(self.bg_hover))
+        if hovered:
+            self.tag_raise(self._body_hover_id, self._body_normal_id)
+        else:
+            self.tag_lower(self._body_hover_id, self._body_normal_id)
+        self.itemconfig(self._text_id, text=self.text, fill=fg)
+    
     def _bind_events(self) -> None:
         """Bind mouse events."""
         self.bind("<Enter>", self._on_enter)
@@ -133,78 +146,65 @@ class RoundedButton(tk.Canvas):
         self.unbind("<ButtonRelease-1>")
     
     def _on_enter(self, event: tk.Event) -> None:
-        """Handle mouse enter."""
-        if not self._disabled:
-            self.current_bg = self.bg_hover
-            self._draw()
-            self.config(cursor="hand2")
+        """Handle mouse enter (a single restack, no repaint)."""
+        self.current_bg = self.bg_hover
+        self.tag_raise(self._body_hover_id, self._body_normal_id)
     
     def _on_leave(self, event: tk.Event) -> None:
-        """Handle mouse leave."""
+        """Handle mouse leave (a single restack, no repaint)."""
         self.current_bg = self.bg_normal
-        self._draw()
-        self.config(cursor="")
-        if self.long_press_timer:
-            self.after_cancel(self.long_press_timer)
-            self.long_press_timer = None
+        self.tag_lower(self._body_hover_id, self._body_normal_id)
+        _LongPressManager.cancel(self)
     
     def _on_press(self, event: tk.Event) -> None:
         """Handle mouse button press."""
         if self._disabled:
             return
-        self.press_start_time = time.time()
-        if self.long_press_command:
-            self.long_press_timer = self.after(
-                int(self.long_press_threshold * 1000),
-                self._check_long_press
-            )
+        _LongPressManager.start(self, int(self.long_press_threshold * 1000))
     
-    def _check_long_press(self) -> None:
-        """Check if long press threshold reached."""
-        if self.press_start_time:
-            elapsed = time.time() - self.press_start_time
-            if elapsed >= self.long_press_threshold and self.long_press_command:
-                self.long_press_command()
-                self.press_start_time = None
+    def _on_long_press(self) -> None:
+        """Called when the button has been held past the threshold."""
+        if self.long_press_command:
+            self.long_press_command()
     
     def _on_release(self, event: tk.Event) -> None:
         """Handle mouse button release."""
         if self._disabled:
             return
         
-        if self.long_press_timer:
-            self.after_cancel(self.long_press_timer)
-            self.long_press_timer = None
+        # Nothing pending: the long press already fired or the pointer left
+        if not _LongPressManager.cancel(self):
+            return
         
-        if self.press_start_time:
-            elapsed = time.time() - self.press_start_time
-            if elapsed < self.long_press_threshold:
-                if self.command:
-                    self.command()
-                elif self.long_press_hint:
-                    # Show hint via toast
-                    top = self.winfo_toplevel()
-                    if hasattr(top, 'show_toast'):
-                        top.show_toast(self.long_press_hint)
-            self.press_start_time = None
+        if self.command:
+            self.command()
+        elif self.long_press_hint:
+            # Show hint via toast
+            top = self.winfo_toplevel()
+            if hasattr(top, 'show_toast'):
+                top.show_toast(self.long_press_hint)
     
     def set_disabled(self, disabled: bool) -> None:
         """Set the disabled state."""
         self._disabled = disabled
+        # <Leave> is unbound while disabled, so the hover state may be stale;
+        # a toggled button always starts out in its normal state
+        self.current_bg = self.bg_normal
         if disabled:
             self._unbind_events()
         else:
             self._bind_events()
-        self._draw()
+        self.configure(cursor="" if disabled else "hand2")
+        self._refresh()
     
     def update_text(self, text: str) -> None:
         """Update the button text."""
         self.text = text
-        self._draw()
+        self._refresh()
     
     def update_colors(self, bg: str, hover_bg: str) -> None:
         """Update button colors."""
         self.bg_normal = bg
         self.bg_hover = hover_bg
         self.current_bg = bg
-        self._draw()
\ No newline at end of file
+        self._refresh()
\ No newline at end of file
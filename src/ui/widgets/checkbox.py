@@ -7,7 +7,11 @@ A styled checkbox with custom appearance matching the app theme.
 import tkinter as tk
 from typing import Callable, Optional
 
-from ..theme import Colors, Fonts
+from ..theme import (
+    get_font,
+    BG_PRIMARY, BG_TERTIARY, ACCENT_WARM, TEXT_PRIMARY, TEXT_SECONDARY,
+)
+from ._bitmaps import get_checkbox_bitmap
 
 
 class ModernCheckbox(tk.Canvas):
@@ -36,78 +40,60 @@ class ModernCheckbox(tk.Canvas):
             command: Callback with new state when toggled
             initial_state: Initial checked state
         """
+        self.box_size = 18
+        self._font = get_font(11)
+        
+        # Size to the measured label once; redraws never change the width
+        text_width = 2 + self.box_size + 8 + self._font.measure(text) + 4
+        
         super().__init__(
             parent,
+            width=max(text_width, 120),
             height=24,
-            bg=Colors.BG_PRIMARY,
-            highlightthickness=0
+            bg=BG_PRIMARY,
+            highlightthickness=0,
+            cursor="hand2"
         )
         
         self.text = text
         self.command = command
         self.checked = initial_state
-        self.box_size = 18
         
-        self._draw()
+        self._build_items()
         self.bind("<Button-1>", self._on_click)
-        self.bind("<Enter>", lambda e: self.config(cursor="hand2"))
-        self.bind("<Leave>", lambda e: self.config(cursor=""))
     
-    def _draw(self) -> None:
-        """Draw the checkbox."""
-        self.delete("all")
-        
-        # Calculate width based on text
-        text_width = len(self.text) * 7 + 30
-        self.config(width=max(text_width, 120))
-        
-        # Box position
+    def _build_items(self) -> None:
+        """Create the box image and label once; toggling only swaps the image."""
         x1, y1 = 2, 3
-        x2, y2 = x1 + self.box_size, y1 + self.box_size
         
-        box_color = Colors.ACCENT_WARM if self.checked else Colors.BG_TERTIARY
-        
-        # Draw rounded box
-        r = 4
-        self.create_arc(x1, y1, x1 + 2*r, y1 + 2*r, start=90, extent=90, fill=box_color, outline=box_color)
-        self.create_arc(x2 - 2*r, y1, x2, y1 + 2*r, start=0, extent=90, fill=box_color, outline=box_color)
-        self.create_arc(x1, y2 - 2*r, x1 + 2*r, y2, start=180, extent=90, fill=box_color, outline=box_color)
-        self.create_arc(x2 - 2*r, y2 - 2*r, x2, y2, start=270, extent=90, fill=box_color, outline=box_color)
-        self.create_rectangle(x1 + r, y1, x2 - r, y2, fill=box_color, outline=box_color)
-        self.create_rectangle(x1, y1 + r, x2, y2 - r, fill=box_color, outline=box_color)
-        
-        # Draw checkmark if checked
-        if self.checked:
-            cx, cy = (x1 + x2) // 2, (y1 + y2) // 2
-            self.create_line(
-                cx - 4, cy,
-                cx - 1, cy + 3,
-                fill=Colors.TEXT_PRIMARY,
-                width=2,
-                capstyle=tk.ROUND
-            )
-            self.create_line(
-                cx - 1, cy + 3,
-                cx + 5, cy - 4,
-                fill=Colors.TEXT_PRIMARY,
-                width=2,
-                capstyle=tk.ROUND
-            )
-        
-        # Draw label text
+        self._box_id = self.create_image(x1, y1, anchor="nw")
         self.create_text(
-            x2 + 8,
-            (y1 + y2) // 2,
+            x1 + self.box_size + 8,
+            y1 + self.box_size // 2,
             text=self.text,
             anchor="w",
-            fill=Colors.TEXT_SECONDARY,
-            font=(Fonts.FAMILY_PRIMARY, 11)
+            fill=TEXT_SECONDARY,
+            font=self._font
+        )
+        
+        self._refresh()
+    
+    def _refresh(self) -> None:
+        """Show the pre-rendered box for the current checked state."""
+        image = get_checkbox_bitmap(
+            self.box_size,
+            self.checked,
+            ACCENT_WARM,
+            BG_TERTIARY,
+            TEXT_PRIMARY,
+            BG_PRIMARY
         )
+        self.itemconfig(self._box_id, image=image)
     
     def _on_click(self, event: tk.Event) -> None:
         """Handle click event."""
         self.checked = not self.checked
-        self._draw()
+        self._refresh()
         if self.command:
             self.command(self.checked)
     
@@ -118,4 +104,4 @@ class ModernCheckbox(tk.Canvas):
     def set_checked(self, checked: bool) -> None:
         """Set checked state."""
         self.checked = checked
-        self._draw()
\ No newline at end of file
+        self._refresh()
\ No newline at end of file
@@ -1,17 +1,18 @@
 """
 Clock Icon Widget
 
-A decorative clock icon drawn with canvas.
+A decorative clock icon shown as a pre-rendered image.
 """
 
 import tkinter as tk
 
-from ..theme import Colors
+from ..theme import BG_PRIMARY, ACCENT_WARM
+from ._bitmaps import get_clock_bitmap
 
 
-class ClockIcon(tk.Canvas):
+class ClockIcon(tk.Label):
     """
-    A clock icon drawn with canvas.
+    A clock icon displayed from a cached bitmap.
     
     Used on the starting page as a decorative element.
     """
@@ -20,7 +21,7 @@ class ClockIcon(tk.Canvas):
         self,
         parent: tk.Widget,
         size: int = 80,
-        color: str = Colors.ACCENT_WARM,
+        color: str = ACCENT_WARM,
     ):
         """
         Initialize the clock icon.
@@ -32,50 +33,16 @@ class ClockIcon(tk.Canvas):
         """
         super().__init__(
             parent,
-            width=size,
-            height=size,
-            bg=Colors.BG_PRIMARY,
+            image=get_clock_bitmap(size, color, BG_PRIMARY),
+            bg=BG_PRIMARY,
+            borderwidth=0,
             highlightthickness=0
         )
         
         self.size = size
         self.color = color
-        self._draw()
-    
-    def _draw(self) -> None:
-        """Draw the clock icon."""
-        self.delete("all")
-        
-        cx, cy = self.size // 2, self.size // 2
-        r = self.size // 2 - 4
-        
-        # Draw circle outline
-        self.create_oval(
-            cx - r, cy - r,
-            cx + r, cy + r,
-            outline=self.color,
-            width=3
-        )
-        
-        # Draw hour hand (pointing to 12)
-        self.create_line(
-            cx, cy,
-            cx, cy - r * 0.5,
-            fill=self.color,
-            width=3,
-            capstyle=tk.ROUND
-        )
-        
-        # Draw minute hand (pointing to 3)
-        self.create_line(
-            cx, cy,
-            cx + r * 0.35, cy,
-            fill=self.color,
-            width=3,
-            capstyle=tk.ROUND
-        )
     
     def set_color(self, color: str) -> None:
         """Update the icon color."""
         self.color = color
-        self._draw()
\ No newline at end of file
+        self.configure(image=get_clock_bitmap(self.size, color, BG_PRIMARY))
\ No newline at end of file
@@ -4,12 +4,64 @@ Custom Dialog Widget
 A themed confirmation dialog that matches the app's design.
 """
 
+import sys
 import tkinter as tk
-import platform
-from typing import Callable
+from functools import lru_cache
+from typing import Callable, Optional
 
-from ..theme import Colors, Fonts
+from ..theme import (
+    get_font, SIZE_NORMAL,
+    BORDER, BG_SECONDARY, BG_TERTIARY, BG_HOVER, TEXT_PRIMARY, TEXT_SECONDARY,
+    ACCENT_WARM, ACCENT_WARM_HOVER,
+)
 from .button import RoundedButton
+from ._geom import _parent_bbox
+from ._stacking import _raise_briefly
+
+_IS_WINDOWS = sys.platform == "win32"
+
+MESSAGE_WIDTH = 300
+
+# Window class of the dialog; scopes its option database defaults
+DIALOG_CLASS = "PomodoroDialog"
+
+# Layout in pixels: window border, content padding and gaps between rows
+BORDER_WIDTH = 2
+PAD_X = 30
+PAD_Y = 25
+TITLE_GAP = 15
+MESSAGE_GAP = 25
+BUTTON_GAP = 10
+
+
+@lru_cache(maxsize=16)
+def _wrap_message(message: str, width: int = MESSAGE_WIDTH) -> str:
+    """
+    Break a message into lines no wider than ``width`` pixels.
+    
+    Wraps once per message using the real font metrics, so the label
+    only renders fixed lines instead of word-wrapping on every layout.
+    
+    Args:
+        message: Text to wrap
+        width: Maximum line width in pixels
+    
+    Returns:
+        The message with line breaks inserted
+    """
+    font = get_font(SIZE_NORMAL)
+    lines = []
+    for paragraph in message.split("\n"):
+        line = ""
+        for word in paragraph.split():
+            candidate = f"{line} {word}" if line else word
+            if line and font.measure(candidate) > width:
+                lines.append(line)
+                line = word
+            else:
+                line = candidate
+        lines.append(line)
+    return "\n".join(lines)
 
 
 class CustomDialog(tk.Toplevel):
@@ -17,6 +69,8 @@ class CustomDialog(tk.Toplevel):
     Custom confirmation dialog.
     
     A modal dialog with custom styling that matches the app theme.
+    Closing only hides the dialog, so one instance can be shown again
+    with show() instead of building a new window each time.
     """
     
     def __init__(
@@ -39,126 +93,184 @@ class CustomDialog(tk.Toplevel):
             confirm_text: Text for confirm button
             cancel_text: Text for cancel button
         """
-        super().__init__(parent)
+        super().__init__(parent, class_=DIALOG_CLASS)
         
         self._parent = parent
         self.on_confirm = on_confirm
         
         # Window setup
         self.title("Confirmation")
-        self.configure(bg=Colors.BG_SECONDARY)
+        # The window background shows around the main frame as its border
+        self.configure(bg=BORDER)
         self.resizable(False, False)
         
+        # Shared defaults for the children, set once instead of per widget.
+        # The class prefix keeps them from applying to the rest of the app.
+        self.option_add(f"*{DIALOG_CLASS}*Background", BG_SECONDARY)
+        self.option_add(f"*{DIALOG_CLASS}*Foreground", TEXT_PRIMARY)
+        self.option_add(f"*{DIALOG_CLASS}*Font", get_font(SIZE_NORMAL))
+        
         # Make it modal and ensure visibility on Windows
         self.transient(parent)
         
         # On Windows, don't use overrideredirect for dialogs
         # as it can cause visibility/focus issues
-        if platform.system() == "Windows":
+        if _IS_WINDOWS:
             # Remove minimize/maximize buttons, keep close button
             self.attributes("-toolwindow", True)
         else:
             self.overrideredirect(True)
         
-        # Ensure it stays on top
-        self.attributes("-topmost", True)
-        
-        # Create outer border frame for visibility
-        border_frame = tk.Frame(self, bg=Colors.BORDER, padx=2, pady=2)
-        border_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Main frame with padding
-        main_frame = tk.Frame(border_frame, bg=Colors.BG_SECONDARY, padx=30, pady=25)
-        main_frame.pack(fill=tk.BOTH, expand=True)
+        # Main frame inset to leave the border visible. Every child is
+        # placed at computed coordinates, so no geometry solver runs.
+        main_frame = tk.Frame(self)
+        main_frame.place(
+            x=BORDER_WIDTH, y=BORDER_WIDTH,
+            relwidth=1, relheight=1,
+            width=-2 * BORDER_WIDTH, height=-2 * BORDER_WIDTH
+        )
         
         # Title
-        title_label = tk.Label(
+        self.title_label = tk.Label(
             main_frame,
             text=title,
-            font=(Fonts.FAMILY_PRIMARY, 16, "bold"),
-            bg=Colors.BG_SECONDARY,
-            fg=Colors.TEXT_PRIMARY
+            font=get_font(16, "bold")
         )
-        title_label.pack(anchor="w", pady=(0, 15))
         
         # Message
-        msg_label = tk.Label(
+        self.msg_label = tk.Label(
             main_frame,
-            text=message,
-            font=(Fonts.FAMILY_PRIMARY, 12),
-            bg=Colors.BG_SECONDARY,
-            fg=Colors.TEXT_SECONDARY,
-            wraplength=300,
+            text=_wrap_message(message),
+            fg=TEXT_SECONDARY,
             justify="left"
         )
-        msg_label.pack(anchor="w", pady=(0, 25))
         
-        # Buttons frame
-        btn_frame = tk.Frame(main_frame, bg=Colors.BG_SECONDARY)
-        btn_frame.pack(anchor="e")
-        
-        cancel_btn = RoundedButton(
-            btn_frame,
+        # Buttons, right-aligned below the message
+        self._cancel_btn = RoundedButton(
+            main_frame,
             text=cancel_text,
             command=self._on_cancel,
-            bg=Colors.BG_TERTIARY,
-            hover_bg=Colors.BG_HOVER,
+            bg=BG_TERTIARY,
+            hover_bg=BG_HOVER,
             width=90,
             height=36
         )
-        cancel_btn.pack(side=tk.LEFT, padx=(0, 10))
         
-        confirm_btn = RoundedButton(
-            btn_frame,
+        self._confirm_btn = RoundedButton(
+            main_frame,
             text=confirm_text,
             command=self._on_confirm,
-            bg=Colors.ACCENT_WARM,
-            hover_bg=Colors.ACCENT_WARM_HOVER,
+            bg=ACCENT_WARM,
+            hover_bg=ACCENT_WARM_HOVER,
             width=90,
             height=36
         )
-        confirm_btn.pack(side=tk.LEFT)
         
-        # Force update and center on parent
-        self.update_idletasks()
-        self._center_on_parent()
+        # Grabs need a viewable window, so take it once Tk maps the dialog
+        self.bind("<Map>", self._on_map)
         
-        # Make modal - grab focus
-        self.grab_set()
-        self.focus_force()
+        self.show(title, message, on_confirm)
         
+        # Wire up the remaining handlers after the first paint
+        self.after_idle(self._finalize)
+    
+    def _finalize(self) -> None:
+        """Finish setup that the first display does not depend on."""
         # Handle escape key and window close
-        self.bind("<Escape>", lambda e: self._on_cancel())
+        self.bind("<Escape>", self._on_cancel)
         self.protocol("WM_DELETE_WINDOW", self._on_cancel)
+    
+    def show(self, title: str, message: str, on_confirm: Callable[[], None]) -> None:
+        """
+        Show the dialog with new content.
+        
+        Args:
+            title: Dialog title
+            message: Dialog message
+            on_confirm: Callback when confirmed
+        """
+        self.on_confirm = on_confirm
+        self.title_label.configure(text=title)
+        self.msg_label.configure(text=_wrap_message(message))
+        
+        # Lay out and center from requested sizes (no forced geometry pass)
+        width, height = self._layout()
+        self._center_on_parent(width, height)
+        self.deiconify()
         
-        # Lift to top
-        self.lift()
+        # Lift over the main window without pinning the dialog on top
+        _raise_briefly(self, self._parent)
     
-    def _center_on_parent(self) -> None:
-        """Center the dialog on the parent window."""
+    def _on_map(self, event: tk.Event) -> None:
+        """Make the dialog modal once it is mapped."""
+        if event.widget is self:
+            # grab_set() is already a local (application-only) grab
+            self.grab_set()
+            self.after_idle(self.focus_set)
+    
+    def _layout(self) -> tuple:
+        """
+        Place the dialog's widgets and size the window to fit them.
+        
+        Labels and buttons know their requested size as soon as they are
+        configured, so positions are computed directly instead of waiting
+        for an idle geometry pass.
+        
+        Returns:
+            (width, height) of the dialog in pixels
+        """
+        title_w = self.title_label.winfo_reqwidth()
+        title_h = self.title_label.winfo_reqheight()
+        msg_w = self.msg_label.winfo_reqwidth()
+        msg_h = self.msg_label.winfo_reqheight()
+        cancel_w = self._cancel_btn.winfo_reqwidth()
+        confirm_w = self._confirm_btn.winfo_reqwidth()
+        row_w = cancel_w + BUTTON_GAP + confirm_w
+        row_h = max(self._cancel_btn.winfo_reqheight(), self._confirm_btn.winfo_reqheight())
+        
+        content_w = max(title_w, msg_w, row_w)
+        msg_y = PAD_Y + title_h + TITLE_GAP
+        row_y = msg_y + msg_h + MESSAGE_GAP
+        row_x = PAD_X + content_w - row_w
+        
+        self.title_label.place(x=PAD_X, y=PAD_Y)
+        self.msg_label.place(x=PAD_X, y=msg_y)
+        self._cancel_btn.place(x=row_x, y=row_y)
+        self._confirm_btn.place(x=row_x + cancel_w + BUTTON_GAP, y=row_y)
+        
+        width = 2 * (BORDER_WIDTH + PAD_X) + content_w
+        height = 2 * BORDER_WIDTH + row_y + row_h + PAD_Y
+        return width, height
+    
+    def _center_on_parent(self, width: int, height: int) -> None:
+        """
+        Give the dialog a fixed size, centered on the parent window.
+        
+        Args:
+            width: Dialog width in pixels
+            height: Dialog height in pixels
+        """
         try:
-            parent_x = self._parent.winfo_rootx()
-            parent_y = self._parent.winfo_rooty()
-            parent_width = self._parent.winfo_width()
-            parent_height = self._parent.winfo_height()
-            
-            dialog_width = self.winfo_width()
-            dialog_height = self.winfo_height()
-            
-            x = parent_x + (parent_width - dialog_width) // 2
-            y = parent_y + (parent_height - dialog_height) // 2
-            
-            self.geometry(f"+{x}+{y}")
+            parent_x, parent_y, parent_width, parent_height = _parent_bbox(self._parent)
         except tk.TclError:
-            pass
+            self.geometry(f"{width}x{height}")
+            return
+        
+        x = parent_x + (parent_width - width) // 2
+        y = parent_y + (parent_height - height) // 2
+        
+        self.geometry(f"{width}x{height}+{x}+{y}")
     
-    def _on_cancel(self) -> None:
-        """Handle cancel action."""
+    def _hide(self) -> None:
+        """Release the grab and hide the dialog for later reuse."""
         self.grab_release()
-        self.destroy()
+        self.withdraw()
+    
+    def _on_cancel(self, event: Optional[tk.Event] = None) -> None:
+        """Handle cancel action (button, Escape key or window close)."""
+        self._hide()
     
     def _on_confirm(self) -> None:
         """Handle confirm action."""
-        self.grab_release()
-        self.destroy()
+        self._hide()
         self.on_confirm()
\ No newline at end of file
@@ -0,0 +1,86 @@
+"""
+Flat Button Widget
+
+A lightweight themed button for secondary actions, with long-press support.
+"""
+
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, Optional
+
+from ..theme import FLAT_BUTTON_STYLE
+from ._long_press import _LongPressManager
+
+
+class FlatButton(ttk.Button):
+    """
+    A native ttk button styled to match the theme.
+    
+    Much lighter than RoundedButton (no canvas or bitmaps); hover and
+    pressed colors come from the style set by configure_ttk_styles().
+    Use it where rounded corners are not needed.
+    """
+    
+    def __init__(
+        self,
+        parent: tk.Widget,
+        text: str,
+        command: Optional[Callable] = None,
+        long_press_command: Optional[Callable] = None,
+        long_press_hint: Optional[str] = None,
+        style: str = FLAT_BUTTON_STYLE,
+    ):
+        """
+        Initialize the flat button.
+        
+        Args:
+            parent: Parent widget
+            text: Button text
+            command: Click callback
+            long_press_command: Callback for long press
+            long_press_hint: Hint shown on short press if long_press_command set
+            style: ttk style name
+        """
+        super().__init__(
+            parent,
+            text=text,
+            style=style,
+            cursor="hand2",
+            takefocus=False
+        )
+        
+        self.command = command
+        self.long_press_command = long_press_command
+        self.long_press_hint = long_press_hint
+        self.long_press_threshold = 0.5  # seconds
+        
+        self.bind("<ButtonPress-1>", self._on_press)
+        self.bind("<ButtonRelease-1>", self._on_release)
+        self.bind("<Leave>", self._on_leave)
+    
+    def _on_press(self, event: tk.Event) -> None:
+        """Handle mouse button press."""
+        _LongPressManager.start(self, int(self.long_press_threshold * 1000))
+    
+    def _on_leave(self, event: tk.Event) -> None:
+        """Handle mouse leave."""
+        _LongPressManager.cancel(self)
+    
+    def _on_long_press(self) -> None:
+        """Called when the button has been held past the threshold."""
+        if self.long_press_command:
+            self.long_press_command()
+    
+    def _on_release(self, event: tk.Event) -> None:
+        """Handle mouse button release."""
+        # Nothing pending: the long press already fired or the pointer left
+        if not _LongPressManager.cancel(self):
+            return
+        
+        if self.command:
+            self.command()
+        elif self.long_press_hint:
+            # Show hint via toast
+            top = self.winfo_toplevel()
+            if hasattr(top, 'show_toast'):
+                top.show_toast(self.long_press_hint)
\ No newline at end of file
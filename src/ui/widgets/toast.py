@@ -4,10 +4,23 @@ Toast Notification Widget
 A transient toast notification that appears at the bottom of the window.
 """
 
+import sys
 import tkinter as tk
-import platform
+from typing import Optional
 
-from ..theme import Colors, Fonts
+from ..theme import (
+    get_font,
+    BORDER, SNACKBAR_BG, TEXT_PRIMARY,
+)
+from ._geom import _parent_bbox
+from ._stacking import _raise_briefly
+
+_IS_WINDOWS = sys.platform == "win32"
+
+# Layout in pixels: window border and content padding
+BORDER_WIDTH = 1
+PAD_X = 20
+PAD_Y = 12
 
 
 class Toast(tk.Toplevel):
@@ -15,9 +28,12 @@ class Toast(tk.Toplevel):
     Modern toast notification.
     
     Displays a message at the bottom of the parent window
-    and auto-dismisses after a few seconds.
+    and auto-dismisses after a few seconds. Use Toast.show() to reuse
+    a single hidden window instead of building one per message.
     """
     
+    _instance: Optional["Toast"] = None
+    
     def __init__(
         self,
         parent: tk.Widget,
@@ -35,14 +51,18 @@ class Toast(tk.Toplevel):
         super().__init__(parent)
         
         self._parent = parent
+        self._message = message
+        # Pending auto-dismiss; set exactly while the toast is showing
+        self._dismiss_id: Optional[str] = None
         
         # Window setup - handle Windows differently
         self.title("")
-        self.configure(bg=Colors.SNACKBAR_BG)
+        # The window background shows around the content as its border
+        self.configure(bg=BORDER)
         self.resizable(False, False)
         
         # Remove window decorations
-        if platform.system() == "Windows":
+        if _IS_WINDOWS:
             # On Windows, use toolwindow style for better compatibility
             self.attributes("-toolwindow", True)
             self.overrideredirect(True)
@@ -55,59 +75,106 @@ class Toast(tk.Toplevel):
         except tk.TclError:
             pass
         
-        # Make sure it stays on top
-        self.attributes("-topmost", True)
-        
-        # Create content with border for visibility
-        outer_frame = tk.Frame(self, bg=Colors.BORDER, padx=1, pady=1)
-        outer_frame.pack(fill=tk.BOTH, expand=True)
-        
-        inner_frame = tk.Frame(outer_frame, bg=Colors.SNACKBAR_BG, padx=20, pady=12)
-        inner_frame.pack(fill=tk.BOTH, expand=True)
+        # Create content, inset to leave the border visible; the label is
+        # placed at a fixed offset, so no geometry solver runs
+        inner_frame = tk.Frame(self, bg=SNACKBAR_BG)
+        inner_frame.place(
+            x=BORDER_WIDTH, y=BORDER_WIDTH,
+            relwidth=1, relheight=1,
+            width=-2 * BORDER_WIDTH, height=-2 * BORDER_WIDTH
+        )
         
-        label = tk.Label(
+        self._label = tk.Label(
             inner_frame,
             text=message,
-            bg=Colors.SNACKBAR_BG,
-            fg=Colors.TEXT_PRIMARY,
-            font=(Fonts.FAMILY_PRIMARY, 11)
+            bg=SNACKBAR_BG,
+            fg=TEXT_PRIMARY,
+            font=get_font(11)
         )
-        label.pack()
+        self._label.place(x=PAD_X, y=PAD_Y)
+        
+        self._show(message, duration)
+    
+    @classmethod
+    def show(cls, parent: tk.Widget, message: str, duration: int = 2500) -> "Toast":
+        """
+        Show a message in the shared toast window, creating it on first use.
         
-        # Force geometry update
-        self.update_idletasks()
+        Args:
+            parent: Parent widget (usually the main window)
+            message: Message to display
+            duration: Display duration in milliseconds
         
-        # Position at bottom center of parent
-        self._position_toast()
+        Returns:
+            The shared toast
+        """
+        toast = cls._instance
+        if toast is None or toast._parent is not parent or not toast.winfo_exists():
+            if toast is not None:
+                toast._destroy()
+            toast = cls(parent, message, duration)
+            cls._instance = toast
+        else:
+            toast._show(message, duration)
+        return toast
+    
+    def _show(self, message: str, duration: int) -> None:
+        """Display a message and (re)start the auto-dismiss timer."""
+        showing = self._dismiss_id is not None
         
-        # Ensure visibility
-        self.lift()
-        self.focus_force()
+        # Coalesce rapid repeats: an identical visible message only
+        # extends its display time
+        if not showing or message != self._message:
+            if message != self._message:
+                self._message = message
+                self._label.configure(text=message)
+            
+            # Position at bottom center of parent, then show
+            self._position_toast()
+            if not showing:
+                self.deiconify()
+                
+                # Ensure visibility; toasts are not interactive, so they
+                # never take focus away from the main window
+                _raise_briefly(self, self._parent)
         
         # Auto-dismiss
-        self.after(duration, self._dismiss)
+        if showing:
+            self.after_cancel(self._dismiss_id)
+        self._dismiss_id = self.after(duration, self._dismiss)
     
     def _position_toast(self) -> None:
-        """Position the toast at the bottom center of parent."""
+        """Size the toast to its message and position it at the bottom center of parent."""
+        # The label's requested size is known without a geometry pass;
+        # add the content padding and the border
+        toast_width = self._label.winfo_reqwidth() + 2 * (PAD_X + BORDER_WIDTH)
+        toast_height = self._label.winfo_reqheight() + 2 * (PAD_Y + BORDER_WIDTH)
+        
         try:
-            parent_x = self._parent.winfo_rootx()
-            parent_y = self._parent.winfo_rooty()
-            parent_width = self._parent.winfo_width()
-            parent_height = self._parent.winfo_height()
-            
-            toast_width = self.winfo_width()
-            toast_height = self.winfo_height()
-            
-            x = parent_x + (parent_width - toast_width) // 2
-            y = parent_y + parent_height - toast_height - 60
-            
-            self.geometry(f"+{x}+{y}")
+            parent_x, parent_y, parent_width, parent_height = _parent_bbox(self._parent)
         except tk.TclError:
-            pass
+            self.geometry(f"{toast_width}x{toast_height}")
+            return
+        
+        x = parent_x + (parent_width - toast_width) // 2
+        y = parent_y + parent_height - toast_height - 60
+        
+        self.geometry(f"{toast_width}x{toast_height}+{x}+{y}")
     
     def _dismiss(self) -> None:
-        """Dismiss the toast."""
+        """Hide the toast, keeping the window for the next message."""
+        self._dismiss_id = None
+        try:
+            self.withdraw()
+        except tk.TclError:
+            pass
+    
+    def _destroy(self) -> None:
+        """Cancel the pending dismiss and destroy the window (when replaced)."""
         try:
+            if self._dismiss_id is not None:
+                self.after_cancel(self._dismiss_id)
+                self._dismiss_id = None
             self.destroy()
         except tk.TclError:
             pass
\ No newline at end of file
@@ -4,6 +4,16 @@ Formatting Utility Functions
 Common formatting and calculation utilities.
 """
 
+from functools import lru_cache
+
+
+# "MM:SS" for every offset within an hour, indexed by seconds % 3600
+_MMSS = tuple(f"{m:02d}:{s:02d}" for m in range(60) for s in range(60))
+
+# Complete strings for the first hour, which covers typical rest
+# countdowns and the start of every work session
+_DURATION_CACHE = tuple("00:" + mmss for mmss in _MMSS) + ("01:00:00",)
+
 
 def format_duration(seconds: int) -> str:
     """
@@ -15,10 +25,11 @@ def format_duration(seconds: int) -> str:
     Returns:
         Formatted string in HH:MM:SS format
     """
-    hours = seconds // 3600
-    minutes = (seconds % 3600) // 60
-    secs = seconds % 60
-    return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+    if 0 <= seconds <= 3600:
+        return _DURATION_CACHE[seconds]
+    hours, rem = divmod(seconds, 3600)
+    # str.zfill skips the format-spec parser that "{:02d}" goes through
+    return f"{str(hours).zfill(2)}:{_MMSS[rem]}"
 
 
 def calculate_rest_duration(
@@ -41,17 +52,20 @@ def calculate_rest_duration(
     Returns:
         Rest duration in seconds
     """
-    work_minutes = work_seconds // 60
-    
-    # Calculate rest minutes based on completed work periods
-    rest_minutes = (work_minutes // work_ratio) * rest_ratio
-    
-    # Add rest for partial work period
-    if work_minutes % work_ratio > 0:
-        rest_minutes += rest_ratio
-    
-    # Ensure minimum rest duration
-    rest_minutes = max(min_rest_minutes, rest_minutes)
+    # Cache per started minute; keying on raw seconds would never repeat
+    return _rest_seconds(work_seconds // 60, min_rest_minutes, rest_ratio, work_ratio)
+
+
+@lru_cache(maxsize=1024)
+def _rest_seconds(
+    work_minutes: int,
+    min_rest_minutes: int,
+    rest_ratio: int,
+    work_ratio: int,
+) -> int:
+    """Rest duration in seconds for whole work minutes (see calculate_rest_duration)."""
+    # Rest for every started work period (ceiling division), at least the minimum
+    rest_minutes = max(min_rest_minutes, -(-work_minutes // work_ratio) * rest_ratio)
     
     return rest_minutes * 60
 
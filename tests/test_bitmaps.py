@@ -0,0 +1,51 @@
+"""Tests for the widget bitmap rasterizer."""
+
+from src.ui.widgets._bitmaps import _rounded_rect_rows, _stroke_rows, _ring_rows
+
+
+class TestRoundedRectRows:
+    """Tests for _rounded_rect_rows function."""
+    
+    def test_dimensions(self):
+        rows = _rounded_rect_rows(20, 10, 4, "#ff0000", "#000000")
+        assert len(rows) == 10
+        assert all(len(row) == 20 for row in rows)
+    
+    def test_center_is_solid(self):
+        rows = _rounded_rect_rows(20, 10, 4, "#ff0000", "#000000")
+        assert rows[5][10] == "#ff0000"
+        assert rows[0][10] == "#ff0000"
+    
+    def test_corners_blend_to_background(self):
+        rows = _rounded_rect_rows(20, 10, 4, "#ff0000", "#000000")
+        assert rows[0][0] == "#000000"
+        assert rows[0][1] not in ("#ff0000", "#000000")
+    
+    def test_zero_radius_is_solid(self):
+        rows = _rounded_rect_rows(6, 4, 0, "#123456", "#000000")
+        assert all(color == "#123456" for row in rows for color in row)
+
+
+class TestStrokeRows:
+    """Tests for _stroke_rows function."""
+    
+    def test_does_not_mutate_input(self):
+        rows = _rounded_rect_rows(10, 10, 0, "#000000", "#000000")
+        _stroke_rows(rows, ((2, 5, 8, 5),), 2, "#ffffff")
+        assert all(color == "#000000" for row in rows for color in row)
+    
+    def test_covers_segment(self):
+        rows = _rounded_rect_rows(10, 10, 0, "#000000", "#000000")
+        stroked = _stroke_rows(rows, ((2, 5, 8, 5),), 2, "#ffffff")
+        assert stroked[5][5] == "#ffffff"
+        assert stroked[0][0] == "#000000"
+
+
+class TestRingRows:
+    """Tests for _ring_rows function."""
+    
+    def test_ring_leaves_center_empty(self):
+        rows = [["#000000"] * 20] * 20
+        ringed = _ring_rows(rows, 10, 10, 8, 3, "#ffffff")
+        assert ringed[10][10] == "#000000"
+        assert ringed[10][18] == "#ffffff"
@@ -7,41 +7,29 @@ from src.utils.formatting import format_duration, calculate_rest_duration
 class TestFormatDuration:
     """Tests for format_duration function."""
     
-    def test_zero_seconds(self):
-        assert format_duration(0) == "00:00:00"
-    
-    def test_seconds_only(self):
-        assert format_duration(45) == "00:00:45"
-    
-    def test_minutes_and_seconds(self):
-        assert format_duration(125) == "00:02:05"
-    
-    def test_hours_minutes_seconds(self):
-        assert format_duration(3661) == "01:01:01"
-    
-    def test_large_hours(self):
-        assert format_duration(36000) == "10:00:00"
+    @pytest.mark.parametrize("seconds, expected", [
+        (0, "00:00:00"),        # zero
+        (45, "00:00:45"),       # seconds only
+        (125, "00:02:05"),      # minutes and seconds
+        (3599, "00:59:59"),     # last cached value below an hour
+        (3600, "01:00:00"),     # cache boundary
+        (3601, "01:00:01"),     # first value past the cache
+        (3661, "01:01:01"),     # hours, minutes and seconds
+        (36000, "10:00:00"),    # large hours
+    ])
+    def test_format_duration(self, seconds, expected):
+        assert format_duration(seconds) == expected
 
 
 class TestCalculateRestDuration:
     """Tests for calculate_rest_duration function."""
     
-    def test_minimum_rest(self):
-        # Even 0 work should give minimum 5 min rest
-        assert calculate_rest_duration(0) == 300  # 5 minutes
-    
-    def test_short_work_gets_minimum(self):
-        # 10 minutes work should still give 5 min rest
-        assert calculate_rest_duration(600) == 300
-    
-    def test_25_minutes_work(self):
-        # 25 minutes work = 5 minutes rest
-        assert calculate_rest_duration(1500) == 300
-    
-    def test_50_minutes_work(self):
-        # 50 minutes work = 10 minutes rest
-        assert calculate_rest_duration(3000) == 600
-    
-    def test_partial_period(self):
-        # 30 minutes work = 10 minutes rest (25 + partial)
-        assert calculate_rest_duration(1800) == 600
\ No newline at end of file
+    @pytest.mark.parametrize("work_seconds, expected", [
+        (0, 300),       # even 0 work gives the 5 min minimum
+        (600, 300),     # 10 min work still gets the minimum
+        (1500, 300),    # 25 min work = 5 min rest
+        (1800, 600),    # 30 min work = 10 min rest (25 + partial)
+        (3000, 600),    # 50 min work = 10 min rest
+    ])
+    def test_calculate_rest_duration(self, work_seconds, expected):
+        assert calculate_rest_duration(work_seconds) == expected
\ No newline at end of file
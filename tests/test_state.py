@@ -0,0 +1,68 @@
+"""Tests for application state."""
+
+import pytest
+from src.core.state import TimerState, AppConfig
+
+
+class TestTimerStateHours:
+    """Tests for the hourly work bookkeeping in TimerState."""
+    
+    def test_no_notification_within_first_hour(self):
+        state = TimerState()
+        for _ in range(3599):
+            state.increment_work()
+            assert not state.should_notify_hour()
+        assert state.current_work_hour == 0
+    
+    def test_notifies_once_per_hour(self):
+        state = TimerState()
+        notified = []
+        for _ in range(2 * 3600 + 10):
+            state.increment_work()
+            if state.should_notify_hour():
+                notified.append(state.current_work_hour)
+        assert notified == [1, 2]
+        assert state.last_hour_notified == 2
+    
+    def test_increment_reports_hour_boundary(self):
+        state = TimerState()
+        rolled = [state.increment_work() for _ in range(3600)]
+        assert rolled.count(True) == 1
+        assert rolled[-1]
+    
+    def test_reset_clears_hour(self):
+        state = TimerState()
+        for _ in range(3600):
+            state.increment_work()
+        state.reset()
+        assert state.current_work_hour == 0
+        assert not state.should_notify_hour()
+    
+    def test_initial_elapsed_sets_hour(self):
+        state = TimerState(elapsed_seconds=7200)
+        assert state.current_work_hour == 2
+        assert not state.should_notify_hour()
+        rolled = [state.increment_work() for _ in range(3600)]
+        assert rolled.index(True) == 3599
+        assert state.current_work_hour == 3
+
+
+class TestAppConfig:
+    """Tests for AppConfig.calculate_rest_duration."""
+    
+    def test_minimum_rest(self):
+        assert AppConfig().calculate_rest_duration(0) == 300
+    
+    def test_full_periods(self):
+        assert AppConfig().calculate_rest_duration(3000) == 600
+    
+    def test_partial_period_rounds_up(self):
+        assert AppConfig().calculate_rest_duration(1800) == 600
+    
+    def test_seconds_below_a_minute_are_ignored(self):
+        # 25 minutes and 59 seconds is still one work period
+        assert AppConfig().calculate_rest_duration(1559) == 300
+    
+    def test_custom_ratio(self):
+        config = AppConfig(min_rest_minutes=1, rest_ratio=2, work_ratio=10)
+        assert config.calculate_rest_duration(25 * 60) == 6 * 60
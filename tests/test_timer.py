@@ -0,0 +1,67 @@
+"""Tests for the timer controller."""
+
+import pytest
+from src.core import timer
+from src.core.state import TimerState
+from src.core.timer import TimerController
+
+
+class FakeRoot:
+    """Stands in for the Tk root: records after() calls without an event loop."""
+    
+    def __init__(self):
+        self.scheduled = []
+    
+    def after(self, delay_ms, callback):
+        self.scheduled.append((delay_ms, callback))
+        return f"after#{len(self.scheduled)}"
+    
+    def after_cancel(self, after_id):
+        pass
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable replacement for time.monotonic in the timer module."""
+    now = [1000.0]
+    monkeypatch.setattr(timer.time, "monotonic", lambda: now[0])
+    return now
+
+
+class TestTickScheduling:
+    """Tests for TimerController's after() scheduling."""
+    
+    def test_ticks_keep_one_second_steps(self, clock):
+        root = FakeRoot()
+        controller = TimerController(TimerState())
+        controller.bind_tk(root)
+        controller.start_work_timer()
+        
+        for _ in range(3):
+            clock[0] += 1.0
+            controller._work_tick()
+        
+        assert [delay for delay, _ in root.scheduled] == [1000] * 4
+        assert controller.timer_state.elapsed_seconds == 3
+    
+    def test_resyncs_after_a_stall(self, clock):
+        root = FakeRoot()
+        ticks = []
+        controller = TimerController(TimerState(), on_tick=lambda: ticks.append(1))
+        controller.bind_tk(root)
+        controller.start_work_timer()
+        
+        # The event loop was blocked (or the system slept) for an hour
+        clock[0] += 3600.0
+        controller._work_tick()
+        
+        # Run every tick that is due immediately, without time passing
+        immediate = 0
+        while root.scheduled[-1][0] == 0 and immediate < 10:
+            immediate += 1
+            root.scheduled[-1][1]()
+        
+        # At most one catch-up tick, then back to the normal cadence
+        assert immediate <= 1
+        assert root.scheduled[-1][0] == 1000
+        assert len(ticks) == 1 + immediate
\ No newline at end of file